@@ -0,0 +1,427 @@
+"""
+Array-Backed Binary Tree
+Author: DSA Project
+Description: Struct-of-arrays binary tree storage with traversals that run directly over index arrays
+"""
+
+import mmap
+import struct
+import sys
+from array import array
+from collections import deque
+
+from tree_iterators import TreeNode
+
+NIL = -1
+
+# File layout: header, then the values, left and right columns back to back
+# in native byte order, so a loaded tree is a zero-copy view of the file
+FILE_MAGIC = b"DSAT"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBcc5xqq")
+
+# Node orders relayout() can renumber a tree into
+LAYOUTS = ("bfs", "preorder", "veb", "blocks")
+
+
+class ArrayTree:
+    """Binary tree stored as parallel value/left/right arrays.
+
+    Node i has value values[i] and children left[i] / right[i], which are
+    node indices or NIL. With the default 'q' typecode a node costs 24
+    bytes instead of a Python object per node. Pass typecode=None to keep
+    arbitrary Python values in a list.
+    """
+
+    layout = None   # Set by relayout() when storage order matches a known layout
+
+    def __init__(self, values=None, left=None, right=None, root=NIL, typecode="q"):
+        self.typecode = typecode
+        self.values = values if values is not None else self.new_values()
+        self.left = left if left is not None else array("q")
+        self.right = right if right is not None else array("q")
+        self.root = root
+
+    def new_values(self):
+        return array(self.typecode) if self.typecode else []
+
+    def __len__(self):
+        return len(self.values)
+
+    def add_node(self, value, left=NIL, right=NIL):
+        """Append a node and return its index"""
+        self.values.append(value)
+        self.left.append(left)
+        self.right.append(right)
+        return len(self.values) - 1
+
+    @classmethod
+    def from_nodes(cls, root, typecode="q"):
+        """Copy a TreeNode tree; nodes are numbered in level order"""
+        tree = cls(typecode=typecode)
+        if root is None:
+            return tree
+        index = {root: tree.add_node(root.value)}
+        queue = deque([root])
+        while queue:
+            node = queue.popleft()
+            i = index[node]
+            if node.left:
+                index[node.left] = tree.left[i] = tree.add_node(node.left.value)
+                queue.append(node.left)
+            if node.right:
+                index[node.right] = tree.right[i] = tree.add_node(node.right.value)
+                queue.append(node.right)
+        tree.root = 0
+        return tree
+
+    @classmethod
+    def from_level_order(cls, items, typecode="q"):
+        """Build from a level-order list where None marks a missing child"""
+        tree = cls(typecode=typecode)
+        items = iter(items)
+        first = next(items, None)
+        if first is None:
+            return tree
+        tree.root = tree.add_node(first)
+        queue = deque([tree.root])
+        while queue:
+            parent = queue.popleft()
+            for side in (tree.left, tree.right):
+                value = next(items, None)
+                if value is not None:
+                    side[parent] = child = tree.add_node(value)
+                    queue.append(child)
+        return tree
+
+    @classmethod
+    def from_sorted(cls, values, typecode="q"):
+        """Build a height-balanced BST from an ascending sequence"""
+        tree = cls(typecode=typecode)
+        if not values:
+            return tree
+        # (lo, hi, parent, side) ranges still to place; middle element becomes the subtree root
+        stack = [(0, len(values) - 1, NIL, None)]
+        while stack:
+            lo, hi, parent, side = stack.pop()
+            mid = (lo + hi) // 2
+            i = tree.add_node(values[mid])
+            if parent == NIL:
+                tree.root = i
+            else:
+                side[parent] = i
+            if mid < hi:
+                stack.append((mid + 1, hi, i, tree.right))
+            if lo < mid:
+                stack.append((lo, mid - 1, i, tree.left))
+        return tree
+
+    @classmethod
+    def from_traversals(cls, preorder, inorder, typecode="q"):
+        """Rebuild a tree with distinct values from its pre-order and in-order sequences"""
+        if len(preorder) != len(inorder):
+            raise ValueError("Pre-order and in-order sequences differ in length")
+        tree = cls(typecode=typecode)
+        if not preorder:
+            return tree
+        values = tree.values
+        tree.root = tree.add_node(preorder[0])
+        stack = [tree.root]
+        j = 0
+        for value in preorder[1:]:
+            node = tree.add_node(value)
+            parent = stack[-1]
+            if values[parent] != inorder[j]:
+                tree.left[parent] = node
+            else:
+                # Climb past every ancestor whose in-order turn has come
+                while stack and values[stack[-1]] == inorder[j]:
+                    parent = stack.pop()
+                    j += 1
+                tree.right[parent] = node
+            stack.append(node)
+        return tree
+
+    def save(self, path):
+        """Write the tree in the binary column format read by load()"""
+        if not self.typecode:
+            raise ValueError("Only typed (array-backed) values can be serialized")
+        header = FILE_HEADER.pack(
+            FILE_MAGIC, FILE_VERSION, self.typecode.encode("ascii"),
+            b"<" if sys.byteorder == "little" else b">", len(self), self.root
+        )
+        with open(path, "wb") as f:
+            f.write(header)
+            for column in (self.values, self.left, self.right):
+                if not isinstance(column, (array, memoryview)):
+                    column = array("q", map(column.__getitem__, range(len(self))))
+                f.write(column)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a saved tree; the columns are read-only views of the file"""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        view = memoryview(mapped)
+        magic, version, typecode, byteorder, count, root = FILE_HEADER.unpack_from(view)
+        if magic != FILE_MAGIC or version != FILE_VERSION:
+            raise ValueError(f"{path} is not a saved ArrayTree")
+        if byteorder != (b"<" if sys.byteorder == "little" else b">"):
+            raise ValueError(f"{path} was written with a different byte order")
+
+        typecode = typecode.decode("ascii")
+        start = FILE_HEADER.size
+        columns = []
+        for code in (typecode, "q", "q"):
+            size = count * array(code).itemsize
+            columns.append(view[start:start + size].cast(code))
+            start += size
+
+        tree = cls(columns[0], columns[1], columns[2], root, typecode)
+        tree.mapped = mapped  # Keep the mapping alive with the tree
+        tree.path = path      # Lets worker processes map the same file
+        return tree
+
+    def to_nodes(self):
+        """Build the equivalent TreeNode tree"""
+        if self.root == NIL:
+            return None
+        nodes = {}
+        for i in self.preorder():
+            nodes[i] = TreeNode(self.values[i])
+        for i, node in nodes.items():
+            if self.left[i] != NIL:
+                node.left = nodes[self.left[i]]
+            if self.right[i] != NIL:
+                node.right = nodes[self.right[i]]
+        return nodes[self.root]
+
+    def relabel(self, order, layout=None):
+        """Copy of the tree with node order[k] stored at index k"""
+        order = array("q", order)
+        if len(order) != len(self):
+            raise ValueError("Order must list every node exactly once")
+        new_index = array("q", bytes(8 * (len(order) + 1)))
+        for k, i in enumerate(order):
+            new_index[i] = k
+        new_index[NIL] = NIL  # Last slot, so NIL children map to NIL
+
+        tree = ArrayTree(typecode=self.typecode)
+        tree.values.extend(map(self.values.__getitem__, order))
+        tree.left = array("q", (new_index[self.left[i]] for i in order))
+        tree.right = array("q", (new_index[self.right[i]] for i in order))
+        tree.root = new_index[self.root]
+        tree.layout = layout
+        return tree
+
+    def relayout(self, layout="veb", block_height=4):
+        """Copy of the tree renumbered so related nodes sit close in memory.
+
+        'bfs' stores level by level, 'preorder' stores every subtree as one
+        contiguous run, 'veb' uses the cache-oblivious van Emde Boas order
+        (recursive top/bottom half-height splits, good for root-to-leaf
+        descents at every cache size) and 'blocks' packs subtrees of
+        block_height levels together, B-tree style.
+        """
+        if layout == "bfs":
+            order = self.levelorder()
+        elif layout == "preorder":
+            order = self.preorder()
+        elif layout == "veb":
+            order = veb_order(self)
+        elif layout == "blocks":
+            order = block_order(self, block_height)
+        else:
+            raise ValueError(f"Unknown layout: {layout}")
+        return self.relabel(order, layout)
+
+    def find(self, value):
+        """Index of value in a binary search tree, or NIL (one root-to-leaf descent)"""
+        values, left, right = self.values, self.left, self.right
+        i = self.root
+        while i != NIL:
+            v = values[i]
+            if value == v:
+                return i
+            i = left[i] if value < v else right[i]
+        return NIL
+
+    # Traversals yield node indices; explicit stacks, no recursion
+    def preorder(self, start=None):
+        """Pre-order: Root -> Left -> Right"""
+        left, right = self.left, self.right
+        start = self.root if start is None else start
+        stack = [start] if start != NIL else []
+        while stack:
+            i = stack.pop()
+            yield i
+            if right[i] != NIL:
+                stack.append(right[i])
+            if left[i] != NIL:
+                stack.append(left[i])
+
+    def inorder(self, start=None):
+        """In-order: Left -> Root -> Right"""
+        left, right = self.left, self.right
+        stack = []
+        i = self.root if start is None else start
+        while stack or i != NIL:
+            while i != NIL:
+                stack.append(i)
+                i = left[i]
+            i = stack.pop()
+            yield i
+            i = right[i]
+
+    def postorder(self, start=None):
+        """Post-order: Left -> Right -> Root"""
+        left, right = self.left, self.right
+        stack = []
+        i = self.root if start is None else start
+        last = NIL
+        while stack or i != NIL:
+            if i != NIL:
+                stack.append(i)
+                i = left[i]
+            else:
+                top = stack[-1]
+                if right[top] != NIL and right[top] != last:
+                    i = right[top]
+                else:
+                    last = stack.pop()
+                    yield last
+
+    def levelorder(self, start=None):
+        """Level-order: Breadth-first traversal"""
+        left, right = self.left, self.right
+        start = self.root if start is None else start
+        queue = deque([start] if start != NIL else [])
+        while queue:
+            i = queue.popleft()
+            yield i
+            if left[i] != NIL:
+                queue.append(left[i])
+            if right[i] != NIL:
+                queue.append(right[i])
+
+    def traverse(self, order):
+        """Values in the given order ('preorder', 'inorder', 'postorder', 'levelorder')"""
+        values = self.values
+        if (order, self.layout) in (("preorder", "preorder"), ("levelorder", "bfs")):
+            # Storage order already is the traversal order
+            return values[:]
+        out = self.new_values()
+        out.extend(map(values.__getitem__, getattr(self, order)()))
+        return out
+
+
+def _frontier(left, right, level, depth):
+    """Nodes depth levels below the nodes in level, left to right"""
+    for _ in range(depth):
+        level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+    return level
+
+
+def veb_order(tree):
+    """Node indices in van Emde Boas order.
+
+    A subtree of height h is laid out as its top floor(h/2) levels, then
+    each subtree hanging below them from left to right, each recursively.
+    Uses an explicit task stack; O(n log log n) for balanced trees.
+    """
+    if tree.root == NIL:
+        return []
+    left, right = tree.left, tree.right
+    height = _height(left, right, tree.root)
+    order = []
+    stack = [(tree.root, height)]
+    while stack:
+        root, h = stack.pop()
+        if h == 1:
+            order.append(root)
+            continue
+        top = h // 2
+        # The top part is finished before any bottom subtree starts
+        stack.extend((child, h - top) for child in reversed(_frontier(left, right, [root], top)))
+        stack.append((root, top))
+    return order
+
+
+def block_order(tree, block_height=4):
+    """Node indices grouped into blocks of block_height levels.
+
+    Each block is one subtree cut block_height levels deep and stored in
+    level order; blocks follow each other in breadth-first order, like the
+    pages of a B-tree.
+    """
+    if tree.root == NIL:
+        return []
+    left, right = tree.left, tree.right
+    order = []
+    blocks = deque([tree.root])
+    while blocks:
+        level = [blocks.popleft()]
+        for _ in range(block_height):
+            order.extend(level)
+            level = _frontier(left, right, level, 1)
+        blocks.extend(level)
+    return order
+
+
+def _height(left, right, root):
+    """Number of levels in the subtree at root"""
+    height = 0
+    level = [root]
+    while level:
+        height += 1
+        level = _frontier(left, right, level, 1)
+    return height
+
+
+class _ImplicitChildren:
+    """Child index lookup for the heap layout: 2i + 1 (left) or 2i + 2 (right)"""
+
+    def __init__(self, size, offset):
+        self.size = size
+        self.offset = offset
+
+    def __getitem__(self, i):
+        child = 2 * i + self.offset
+        return child if child < self.size else NIL
+
+
+class CompleteTree(ArrayTree):
+    """Complete binary tree in implicit heap layout: only values are stored"""
+
+    def __init__(self, values, typecode="q"):
+        if typecode and not isinstance(values, array):
+            values = array(typecode, values)
+        n = len(values)
+        super().__init__(values, _ImplicitChildren(n, 1), _ImplicitChildren(n, 2),
+                         0 if n else NIL, typecode)
+
+    def add_node(self, value, left=NIL, right=NIL):
+        raise TypeError("CompleteTree has a fixed heap layout; build a new tree instead")
+
+    def levelorder(self, start=None):
+        if start not in (None, 0):
+            return super().levelorder(start)
+        return iter(range(len(self.values)))
+
+    def traverse(self, order):
+        values = self.values
+        n = len(values)
+        if order == "levelorder":
+            # Level order is storage order
+            return values[:]
+        if order == "inorder" and n and n & (n + 1) == 0:
+            # Perfect tree: level d lands at in-order positions
+            # 2^(h-1-d) - 1 + k * 2^(h-d), so each level is one slice copy
+            height = n.bit_length()
+            out = values[:]
+            for d in range(height):
+                stride = 1 << (height - d)
+                first = (stride >> 1) - 1
+                out[first::stride] = values[(1 << d) - 1:(1 << (d + 1)) - 1]
+            return out
+        return super().traverse(order)
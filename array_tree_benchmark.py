@@ -0,0 +1,139 @@
+"""
+Array Tree - Layout Benchmark
+Author: DSA Project
+Description: Times traversals and root-to-leaf searches over pointer nodes and array trees in different memory layouts
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+
+from array_tree import ArrayTree, LAYOUTS, NIL
+from tree_iterators import iter_preorder, iter_inorder, iter_levelorder
+
+
+ORDERS = ("preorder", "inorder", "levelorder")
+POINTER_ORDERS = {
+    "preorder": iter_preorder,
+    "inorder": iter_inorder,
+    "levelorder": iter_levelorder,
+}
+
+
+def best_time(func, repeat):
+    """Fastest wall time of several runs"""
+    best = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best
+
+
+def pointer_find(root, value):
+    """Root-to-leaf descent over TreeNode objects"""
+    node = root
+    while node is not None:
+        if value == node.value:
+            return node
+        node = node.left if value < node.value else node.right
+    return None
+
+
+def build_trees(n, layouts, pointer_limit, seed):
+    """The same n-node BST in every requested layout"""
+    base = ArrayTree.from_sorted(range(n))
+    trees = {}
+    if n <= pointer_limit:
+        trees["pointer"] = base.to_nodes()
+    # Shuffled numbering: neighbours in the tree are scattered through memory
+    order = list(base.preorder())
+    random.Random(seed).shuffle(order)
+    trees["random"] = base.relabel(order)
+    for layout in layouts:
+        trees[layout] = base.relayout(layout)
+    return trees
+
+
+def run_benchmark(sizes, layouts, repeat, searches, pointer_limit, seed):
+    """Time every traversal order and a batch of searches per layout; returns result rows"""
+    results = []
+    for n in sizes:
+        trees = build_trees(n, layouts, pointer_limit, seed)
+        keys = [random.Random(seed + i).randrange(n) for i in range(searches)]
+        expected = None
+        for name, tree in trees.items():
+            row = {"nodes": n, "layout": name}
+            for order in ORDERS:
+                if name == "pointer":
+                    walk = POINTER_ORDERS[order]
+                    row[order] = best_time(lambda: [node.value for node in walk(tree)], repeat)
+                else:
+                    row[order] = best_time(lambda: tree.traverse(order), repeat)
+
+            if name == "pointer":
+                row["search"] = best_time(lambda: [pointer_find(tree, k) for k in keys], repeat)
+                found = sum(pointer_find(tree, k) is not None for k in keys)
+            else:
+                row["search"] = best_time(lambda: [tree.find(k) for k in keys], repeat)
+                found = sum(tree.find(k) != NIL for k in keys)
+            if expected is None:
+                expected = found
+            elif found != expected:
+                raise RuntimeError(f"{name} layout found {found} keys, expected {expected}")
+            results.append(row)
+    return results
+
+
+def print_results(results):
+    """Print times per layout with the speedup over the shuffled (cache-hostile) layout"""
+    header = f"{'nodes':>10} {'layout':<9}" + "".join(f" {col:>16}" for col in ORDERS + ("search",))
+    print(header)
+    print("-" * len(header))
+    reference = {r["nodes"]: r for r in results if r["layout"] == "random"}
+    for r in results:
+        ref = reference[r["nodes"]]
+        cells = []
+        for col in ORDERS + ("search",):
+            speedup = ref[col] / r[col] if r[col] else float("inf")
+            cells.append(f" {r[col]:>8.3f}s {speedup:>5.1f}x")
+        print(f"{r['nodes']:>10} {r['layout']:<9}" + "".join(cells))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark array tree memory layouts")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000_000],
+                        help="tree sizes in nodes (default 1,000,000)")
+    parser.add_argument("--layouts", nargs="+", default=list(LAYOUTS), choices=list(LAYOUTS))
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per measurement")
+    parser.add_argument("--searches", type=int, default=100_000, help="random keys looked up per layout")
+    parser.add_argument("--pointer-limit", type=int, default=5_000_000,
+                        help="largest tree also measured as TreeNode objects")
+    parser.add_argument("--seed", type=int, default=2024, help="shuffle and key seed")
+    parser.add_argument("--output", help="write results to this JSON file")
+    args = parser.parse_args()
+
+    results = run_benchmark(args.sizes, args.layouts, args.repeat, args.searches,
+                            args.pointer_limit, args.seed)
+    print_results(results)
+
+    if args.output:
+        report = {
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,408 @@
+"""
+Self-Balancing Binary Search Trees
+Author: DSA Project
+Description: AVL and red-black trees with O(log n) insert/search/delete, bulk loading and rotation callbacks for animation
+"""
+
+
+class AVLNode:
+    """AVL tree node; height counts levels in the node's subtree"""
+    __slots__ = ('value', 'left', 'right', 'height')
+
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.height = 1
+
+
+class RBNode:
+    """Red-black tree node with a parent link"""
+    __slots__ = ('value', 'left', 'right', 'parent', 'red')
+
+    def __init__(self, value, parent=None):
+        self.value = value
+        self.left = None
+        self.right = None
+        self.parent = parent
+        self.red = True
+
+
+def _height(node):
+    return node.height if node is not None else 0
+
+
+def _is_red(node):
+    return node is not None and node.red
+
+
+class BalancedBST:
+    """Shared search, rotation and bulk-load logic for the balanced trees.
+
+    Nodes expose value/left/right like TreeNode, so the traversal
+    generators and the tree canvas work on them directly. on_rotate, when
+    set, is called as on_rotate(direction, node, pivot) after every
+    rotation, once the tree is consistent again around the rotated pair;
+    node is the old subtree root and pivot the new one.
+    """
+
+    node_class = None
+
+    def __init__(self, values=(), on_rotate=None):
+        self.root = None
+        self.size = 0
+        self.rotations = 0
+        self.on_rotate = on_rotate
+        if values:
+            self.bulk_insert(values)
+
+    def __len__(self):
+        return self.size
+
+    def __contains__(self, value):
+        return self.search(value) is not None
+
+    def __iter__(self):
+        """Values in ascending order"""
+        stack = []
+        node = self.root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            yield node.value
+            node = node.right
+
+    def search_path(self, value):
+        """Nodes visited while searching for value, ending at its node if present"""
+        path = []
+        node = self.root
+        while node is not None:
+            path.append(node)
+            if value == node.value:
+                break
+            node = node.left if value < node.value else node.right
+        return path
+
+    def search(self, value):
+        """Node holding value, or None"""
+        path = self.search_path(value)
+        if path and path[-1].value == value:
+            return path[-1]
+        return None
+
+    def replace_child(self, parent, old, new):
+        """Point parent (or the root) at new instead of old"""
+        if parent is None:
+            self.root = new
+        elif parent.left is old:
+            parent.left = new
+        else:
+            parent.right = new
+
+    def rotate(self, node, parent, direction):
+        """Rotate the subtree at node left or right; returns the new subtree root"""
+        if direction == "left":
+            pivot = node.right
+            moved = node.right = pivot.left
+            pivot.left = node
+        else:
+            pivot = node.left
+            moved = node.left = pivot.right
+            pivot.right = node
+        self.replace_child(parent, node, pivot)
+        self.rotated(node, pivot, moved, parent)
+        self.rotations += 1
+        if self.on_rotate is not None:
+            self.on_rotate(direction, node, pivot)
+        return pivot
+
+    def rotated(self, node, pivot, moved, parent):
+        """Hook to fix per-node bookkeeping after a rotation"""
+
+    def bulk_insert(self, values):
+        """Insert many values at once by rebuilding from the merged sorted sequence.
+
+        O(n + k log k) for k new values instead of k separate rebalancing
+        inserts; no rotation callbacks fire. Returns the number added.
+        """
+        new = sorted(set(values))
+        if not new:
+            return 0
+        old = list(self)
+        if old:
+            merged = []
+            i = j = 0
+            while i < len(old) and j < len(new):
+                if old[i] < new[j]:
+                    merged.append(old[i])
+                    i += 1
+                elif new[j] < old[i]:
+                    merged.append(new[j])
+                    j += 1
+                else:
+                    merged.append(old[i])
+                    i += 1
+                    j += 1
+            merged.extend(old[i:])
+            merged.extend(new[j:])
+        else:
+            merged = new
+
+        added = len(merged) - len(old)
+        self.build_sorted(merged)
+        return added
+
+    def build_sorted(self, values):
+        """Replace the tree with a perfectly balanced one over ascending values"""
+        self.root = None
+        self.size = len(values)
+        created = []    # (node, parent, depth) with parents before children
+        # (lo, hi, parent, is_left, depth) ranges still to place
+        stack = [(0, len(values) - 1, None, False, 0)] if values else []
+        while stack:
+            lo, hi, parent, is_left, depth = stack.pop()
+            mid = (lo + hi) // 2
+            node = self.node_class(values[mid])
+            if parent is None:
+                self.root = node
+            elif is_left:
+                parent.left = node
+            else:
+                parent.right = node
+            created.append((node, parent, depth))
+            if mid < hi:
+                stack.append((mid + 1, hi, node, False, depth + 1))
+            if lo < mid:
+                stack.append((lo, mid - 1, node, True, depth + 1))
+        self.finish_build(created)
+
+    def finish_build(self, created):
+        """Hook to set balance data on a freshly built tree"""
+
+
+class AVLTree(BalancedBST):
+    """AVL tree: sibling subtree heights differ by at most one"""
+
+    node_class = AVLNode
+
+    def insert(self, value):
+        """Insert value; returns False if it was already present"""
+        path = []
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return False
+            path.append(node)
+            node = node.left if value < node.value else node.right
+
+        new = AVLNode(value)
+        if not path:
+            self.root = new
+        elif value < path[-1].value:
+            path[-1].left = new
+        else:
+            path[-1].right = new
+        self.size += 1
+        self.rebalance_path(path)
+        return True
+
+    def delete(self, value):
+        """Remove value; returns False if it was not present"""
+        path = []
+        node = self.root
+        while node is not None and node.value != value:
+            path.append(node)
+            node = node.left if value < node.value else node.right
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Take the in-order successor's value and unlink the successor instead
+            path.append(node)
+            successor = node.right
+            while successor.left is not None:
+                path.append(successor)
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        self.replace_child(path[-1] if path else None, node, child)
+        self.size -= 1
+        self.rebalance_path(path)
+        return True
+
+    def rebalance_path(self, path):
+        """Restore heights and balance from the deepest node of path up to the root"""
+        for k in range(len(path) - 1, -1, -1):
+            node = path[k]
+            parent = path[k - 1] if k else None
+            node.height = 1 + max(_height(node.left), _height(node.right))
+            balance = _height(node.left) - _height(node.right)
+            if balance > 1:
+                if _height(node.left.left) < _height(node.left.right):
+                    self.rotate(node.left, node, "left")
+                self.rotate(node, parent, "right")
+            elif balance < -1:
+                if _height(node.right.right) < _height(node.right.left):
+                    self.rotate(node.right, node, "right")
+                self.rotate(node, parent, "left")
+
+    def rotated(self, node, pivot, moved, parent):
+        node.height = 1 + max(_height(node.left), _height(node.right))
+        pivot.height = 1 + max(_height(pivot.left), _height(pivot.right))
+
+    def finish_build(self, created):
+        for node, _, _ in reversed(created):
+            node.height = 1 + max(_height(node.left), _height(node.right))
+
+
+class RedBlackTree(BalancedBST):
+    """Red-black tree: no red node has a red child and every root-to-leaf
+    path passes the same number of black nodes"""
+
+    node_class = RBNode
+
+    def insert(self, value):
+        """Insert value; returns False if it was already present"""
+        parent = None
+        node = self.root
+        while node is not None:
+            if value == node.value:
+                return False
+            parent = node
+            node = node.left if value < node.value else node.right
+
+        node = RBNode(value, parent)
+        if parent is None:
+            self.root = node
+        elif value < parent.value:
+            parent.left = node
+        else:
+            parent.right = node
+        self.size += 1
+        self.insert_fixup(node)
+        return True
+
+    def insert_fixup(self, node):
+        while _is_red(node.parent):
+            parent = node.parent
+            grand = parent.parent
+            if parent is grand.left:
+                uncle = grand.right
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grand.red = True
+                    node = grand
+                    continue
+                if node is parent.right:
+                    node = parent
+                    parent = self.rotate(node, grand, "left")
+                parent.red = False
+                grand.red = True
+                self.rotate(grand, grand.parent, "right")
+            else:
+                uncle = grand.left
+                if _is_red(uncle):
+                    parent.red = uncle.red = False
+                    grand.red = True
+                    node = grand
+                    continue
+                if node is parent.left:
+                    node = parent
+                    parent = self.rotate(node, grand, "right")
+                parent.red = False
+                grand.red = True
+                self.rotate(grand, grand.parent, "left")
+        self.root.red = False
+
+    def delete(self, value):
+        """Remove value; returns False if it was not present"""
+        node = self.search(value)
+        if node is None:
+            return False
+
+        if node.left is not None and node.right is not None:
+            # Take the in-order successor's value and unlink the successor instead
+            successor = node.right
+            while successor.left is not None:
+                successor = successor.left
+            node.value = successor.value
+            node = successor
+
+        child = node.left if node.left is not None else node.right
+        parent = node.parent
+        self.replace_child(parent, node, child)
+        self.size -= 1
+        if not node.red:
+            if _is_red(child):
+                child.red = False
+            else:
+                self.delete_fixup(child, parent)
+        return True
+
+    def delete_fixup(self, node, parent):
+        # node carries an extra black; it may be None, so its parent is tracked separately
+        while node is not self.root and not _is_red(node):
+            if node is parent.left:
+                sibling = parent.right
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self.rotate(parent, parent.parent, "left")
+                    sibling = parent.right
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                    continue
+                if not _is_red(sibling.right):
+                    sibling.left.red = False
+                    sibling.red = True
+                    sibling = self.rotate(sibling, parent, "right")
+                sibling.red = parent.red
+                parent.red = False
+                sibling.right.red = False
+                self.rotate(parent, parent.parent, "left")
+            else:
+                sibling = parent.left
+                if sibling.red:
+                    sibling.red = False
+                    parent.red = True
+                    self.rotate(parent, parent.parent, "right")
+                    sibling = parent.left
+                if not _is_red(sibling.left) and not _is_red(sibling.right):
+                    sibling.red = True
+                    node = parent
+                    parent = node.parent
+                    continue
+                if not _is_red(sibling.left):
+                    sibling.right.red = False
+                    sibling.red = True
+                    sibling = self.rotate(sibling, parent, "left")
+                sibling.red = parent.red
+                parent.red = False
+                sibling.left.red = False
+                self.rotate(parent, parent.parent, "right")
+            node = self.root
+        if node is not None:
+            node.red = False
+
+    def replace_child(self, parent, old, new):
+        super().replace_child(parent, old, new)
+        if new is not None:
+            new.parent = parent
+
+    def rotated(self, node, pivot, moved, parent):
+        node.parent = pivot
+        if moved is not None:
+            moved.parent = node
+
+    def finish_build(self, created):
+        # Only the deepest level is red, which keeps every path's black count equal
+        deepest = max(depth for _, _, depth in created) if created else 0
+        for node, parent, depth in created:
+            node.parent = parent
+            node.red = depth == deepest and depth > 0
@@ -0,0 +1,381 @@
+"""
+Tower of Hanoi - Move Sequence Files
+Author: DSA Project
+Description: Streams move sequences to and from packed binary (3 bits or 1 byte per move), run-length and plain text files, replaying them against the rules while decoding
+"""
+
+import argparse
+import itertools
+import os
+import re
+import struct
+
+from hanoi_solver import config_of, frame_stewart_moves, hanoi_moves, towers_of
+
+FORMATS = ("bin3", "bin8", "rle", "text")
+PEG_LETTERS = "ABCDEFGHIJKLMNOP"    # bin8 stores a peg in 4 bits
+
+# Binary layout: header, one byte per disk giving its starting peg, then the
+# moves. bin8 stores source << 4 | destination per byte; bin3 packs eight
+# 3-bit pair codes into three bytes, padding the last group with PAD_CODE.
+FILE_MAGIC = b"HANO"
+FILE_VERSION = 1
+FILE_HEADER = struct.Struct("<4sBBBxH")     # magic, version, bits per move, pegs, disks
+PAIRS = ((0, 1), (0, 2), (1, 0), (1, 2), (2, 0), (2, 1))
+PAIR_CODE = {pair: code for code, pair in enumerate(PAIRS)}
+PAD_CODE = 7
+BYTE_CODE = {(s, d): s << 4 | d for s in range(16) for d in range(16)}
+
+CHUNK = 1 << 16     # Moves per read/write batch; a multiple of 8 keeps bin3 groups whole
+
+# Run-length tokens: '+' / '-' move the smallest disk one peg right / left
+# (cyclically), 'F' is the one legal 3-peg move that leaves the smallest disk
+# alone, 'ac' is a literal move from A to C. Symbols are paired and equal
+# consecutive pairs collapse to count(pair), so an optimal 3-peg solution is
+# just "(2^(n-1) - 1)(+F) +" (or '-' for the other direction).
+SYMBOL = re.compile(r"[+\-F]|[a-p]{2}")
+RUN = re.compile(r"(\d+)\((.+)\)|(.+)")
+TOKENS_PER_LINE = 16
+
+
+class IllegalMove(ValueError):
+    """A move that breaks the rules; index is its 1-based position in the sequence"""
+
+    def __init__(self, index, move, reason):
+        source, destination = move
+        super().__init__(f"Move {index} ({source} -> {destination}): {reason}")
+        self.index = index
+        self.move = move
+        self.reason = reason
+
+
+class Replay:
+    """Peg contents advanced move by move, rejecting any illegal move"""
+
+    def __init__(self, start):
+        self.towers = [list(tower) for tower in start]
+        self.count = 0
+        # Peg holding the smallest disk, for the run-length symbols
+        self.small = next((peg for peg, tower in enumerate(self.towers) if 1 in tower), None)
+
+    def apply(self, source, destination):
+        """Make one move; returns the disk moved"""
+        self.count += 1
+        towers = self.towers
+        if not (0 <= source < len(towers) and 0 <= destination < len(towers)) or source == destination:
+            raise IllegalMove(self.count, (source, destination), "not a move between two pegs")
+        if not towers[source]:
+            raise IllegalMove(self.count, (source, destination), "source peg is empty")
+        disk = towers[source][-1]
+        if towers[destination] and towers[destination][-1] < disk:
+            raise IllegalMove(self.count, (source, destination),
+                              f"disk {disk} onto smaller disk {towers[destination][-1]}")
+        towers[destination].append(towers[source].pop())
+        if disk == 1:
+            self.small = destination
+        return disk
+
+
+def start_towers(disks, pegs, start=None):
+    """Starting peg contents: the given ones, or every disk on the first peg"""
+    if start is None:
+        start = [list(range(disks, 0, -1))] + [[] for _ in range(pegs - 1)]
+    if len(start) != pegs or sorted(d for tower in start for d in tower) != list(range(1, disks + 1)):
+        raise ValueError(f"Start position must hold disks 1..{disks} on {pegs} pegs")
+    return start
+
+
+def export_moves(path, moves, disks, pegs=3, fmt="bin8", start=None):
+    """Stream moves into a file; returns the number of moves written.
+
+    moves may be any iterable, such as a lazy solver generator: it is
+    consumed in batches of CHUNK moves, so memory use does not grow with
+    the sequence length.
+    """
+    if fmt not in FORMATS:
+        raise ValueError(f"Unknown move file format: {fmt}")
+    if fmt == "bin3" and pegs != 3:
+        raise ValueError("bin3 packs 3-peg moves only")
+    if not 3 <= pegs <= len(PEG_LETTERS):
+        raise ValueError(f"Move files support 3 to {len(PEG_LETTERS)} pegs")
+    start = start_towers(disks, pegs, start)
+    place = config_of(start)[1:]
+    moves = iter(moves)
+    batches = iter(lambda: list(itertools.islice(moves, CHUNK)), [])
+
+    count = 0
+    if fmt in ("bin3", "bin8"):
+        pack = pack_bin3 if fmt == "bin3" else pack_bin8
+        with open(path, "wb") as f:
+            f.write(FILE_HEADER.pack(FILE_MAGIC, FILE_VERSION, 3 if fmt == "bin3" else 8, pegs, disks))
+            f.write(bytes(place))
+            for batch in batches:
+                f.write(pack(batch))
+                count += len(batch)
+        return count
+
+    with open(path, "w", encoding="ascii") as f:
+        letters = "".join(PEG_LETTERS[peg] for peg in place)
+        f.write(f"# hanoi {fmt} pegs={pegs} disks={disks} start={letters}\n")
+        if fmt == "rle":
+            return write_rle(f, batches, start)
+        names = [a + b + "\n" for a in PEG_LETTERS[:pegs] for b in PEG_LETTERS[:pegs]]
+        for batch in batches:
+            f.write("".join([names[s * pegs + d] for s, d in batch]))
+            count += len(batch)
+    return count
+
+
+def pack_bin8(batch):
+    """One byte per move: source << 4 | destination"""
+    try:
+        return bytes(map(BYTE_CODE.__getitem__, batch))
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]} is not a move between pegs 0-15") from None
+
+
+def pack_bin3(batch):
+    """Eight 3-bit pair codes per three bytes; a short final group is padded"""
+    try:
+        codes = list(map(PAIR_CODE.__getitem__, batch))
+    except KeyError as e:
+        raise ValueError(f"{e.args[0]} is not a 3-peg move") from None
+    codes.extend([PAD_CODE] * (-len(codes) % 8))
+    out = bytearray()
+    for a, b, c, d, e, f, g, h in zip(*[iter(codes)] * 8):
+        group = a | b << 3 | c << 6 | d << 9 | e << 12 | f << 15 | g << 18 | h << 21
+        out += group.to_bytes(3, "little")
+    return bytes(out)
+
+
+def _bin3_table():
+    """Moves for every 12-bit half group (four codes); None marks a corrupt code"""
+    table = []
+    for half in range(1 << 12):
+        moves = []
+        for i in range(4):
+            code = half >> (3 * i) & 7
+            if code == PAD_CODE:
+                break
+            if code >= len(PAIRS):
+                moves = None
+                break
+            moves.append(PAIRS[code])
+        table.append(None if moves is None else tuple(moves))
+    return table
+
+
+BIN3_TABLE = _bin3_table()
+# The same half groups as one-byte (bin8) move codes
+BIN3_CODES = [None if moves is None else bytes([s << 4 | d for s, d in moves]) for moves in BIN3_TABLE]
+
+
+def bin3_to_bin8(data):
+    """Re-encode packed 3-bit moves (whole three-byte groups) as one-byte move codes"""
+    halves = BIN3_CODES
+    parts = []
+    for a, b, c in zip(data[0::3], data[1::3], data[2::3]):
+        group = a | b << 8 | c << 16
+        parts += (halves[group & 4095], halves[group >> 12])
+    try:
+        return b"".join(parts)
+    except TypeError:
+        raise ValueError("Corrupt pair code in bin3 move file") from None
+
+
+def write_rle(f, batches, start):
+    """Write the run-length token stream; returns the number of moves"""
+    replay = Replay(start)
+    pegs = len(start)
+    tokens = 0
+    run, run_count = None, 0
+
+    def emit(unit, count):
+        nonlocal tokens
+        if tokens:
+            f.write(" " if tokens % TOKENS_PER_LINE else "\n")
+        f.write(unit if count == 1 else f"{count}({unit})")
+        tokens += 1
+
+    pending = None
+    for batch in batches:
+        for source, destination in batch:
+            disk = replay.apply(source, destination)
+            if disk == 1 and destination == (source + 1) % pegs:
+                symbol = "+"
+            elif disk == 1 and destination == (source - 1) % pegs:
+                symbol = "-"
+            elif pegs == 3 and disk != 1:
+                symbol = "F"
+            else:
+                symbol = (PEG_LETTERS[source] + PEG_LETTERS[destination]).lower()
+
+            if pending is None:
+                pending = symbol
+                continue
+            unit = pending + symbol
+            pending = None
+            if unit == run:
+                run_count += 1
+            else:
+                if run is not None:
+                    emit(run, run_count)
+                run, run_count = unit, 1
+    if run is not None:
+        emit(run, run_count)
+    if pending is not None:
+        emit(pending, 1)
+    f.write("\n")
+    return replay.count
+
+
+def read_header(f):
+    """(fmt, pegs, disks, start towers) of an open move file, leaving f at the first move"""
+    head = f.read(FILE_HEADER.size)
+    if head[:4] == FILE_MAGIC:
+        magic, version, bits, pegs, disks = FILE_HEADER.unpack(head)
+        if version != FILE_VERSION or bits not in (3, 8):
+            raise ValueError("Unsupported move file version")
+        place = f.read(disks)
+        if len(place) != disks or max(place, default=0) >= pegs:
+            raise ValueError("Truncated or corrupt move file header")
+        return f"bin{bits}", pegs, disks, towers_of((0,) + tuple(place), pegs)
+
+    line = (head + f.readline()).decode("ascii").split()
+    fields = dict(item.split("=", 1) for item in line[3:] if "=" in item)
+    if line[:2] != ["#", "hanoi"] or len(line) < 3 or line[2] not in ("rle", "text"):
+        raise ValueError("Not a Hanoi move file")
+    pegs, disks = int(fields["pegs"]), int(fields["disks"])
+    place = [PEG_LETTERS.index(letter) for letter in fields.get("start", "A" * disks)]
+    if len(place) != disks or max(place, default=0) >= pegs:
+        raise ValueError("Corrupt move file header")
+    return line[2], pegs, disks, towers_of([0] + place, pegs)
+
+
+def read_moves(path, validate=True):
+    """Lazily yield the (source, destination) moves stored in a file of any format.
+
+    With validate, the moves are replayed from the file's start position
+    and IllegalMove is raised at the first one that breaks the rules.
+    Run-length files are always replayed, since their symbols depend on
+    the position.
+    """
+    with open(path, "rb") as f:
+        fmt, pegs, disks, start = read_header(f)
+        if fmt == "rle":
+            yield from decode_rle(f, Replay(start))
+            return
+        decode = {"bin3": decode_bin3, "bin8": decode_bin8, "text": decode_text}[fmt]
+        replay = Replay(start) if validate else None
+        for batch in decode(f, pegs):
+            if replay is not None:
+                apply = replay.apply
+                for source, destination in batch:
+                    apply(source, destination)
+            yield from batch
+
+
+def decode_bin8(f, pegs):
+    """Batches of moves from one-byte-per-move data, starting at the current file position"""
+    for data in iter(lambda: f.read(CHUNK), b""):
+        yield [(byte >> 4, byte & 15) for byte in data]
+
+
+def decode_bin3(f, pegs):
+    """Batches of moves from packed 3-bit data; f must sit on a three-byte group boundary"""
+    table = BIN3_TABLE
+    for data in iter(lambda: f.read(CHUNK // 8 * 3), b""):
+        if len(data) % 3:
+            raise ValueError("Truncated bin3 move file")
+        out = []
+        extend = out.extend
+        try:
+            for i in range(0, len(data), 3):
+                group = data[i] | data[i + 1] << 8 | data[i + 2] << 16
+                extend(table[group & 4095])
+                extend(table[group >> 12])
+        except TypeError:
+            raise ValueError("Corrupt pair code in bin3 move file") from None
+        yield out
+
+
+def decode_text(f, pegs):
+    """Batches of moves from two-letter text lines"""
+    names = {(a + b).encode("ascii"): (s, d)
+             for s, a in enumerate(PEG_LETTERS[:pegs]) for d, b in enumerate(PEG_LETTERS[:pegs])}
+    for lines in iter(lambda: f.readlines(1 << 20), []):
+        try:
+            yield [names[line.strip()] for line in lines if not line.isspace()]
+        except KeyError as e:
+            raise ValueError(f"Not a move: {e.args[0]!r}") from None
+
+
+def decode_rle(f, replay):
+    """Expand run-length tokens against the replayed position, CHUNK moves at a time"""
+    towers = replay.towers
+    pegs = len(towers)
+    apply = replay.apply
+    out = []
+    for line in f:
+        for word in line.decode("ascii").split():
+            match = RUN.fullmatch(word)
+            count = int(match.group(1)) if match.group(1) else 1
+            unit = match.group(2) or match.group(3)
+            symbols = SYMBOL.findall(unit)
+            if "".join(symbols) != unit:
+                raise ValueError(f"Not a run-length token: {word!r}")
+            for _ in range(count):
+                for symbol in symbols:
+                    if symbol == "+" or symbol == "-":
+                        if replay.small is None:
+                            raise IllegalMove(replay.count + 1, (None, None), "there is no smallest disk")
+                        source = replay.small
+                        destination = (source + (1 if symbol == "+" else -1)) % pegs
+                    elif symbol == "F":
+                        if pegs != 3:
+                            raise ValueError("Forced moves are only defined for 3 pegs")
+                        x, y = [peg for peg in range(3) if peg != replay.small]
+                        if not towers[y] or (towers[x] and towers[x][-1] < towers[y][-1]):
+                            source, destination = x, y
+                        else:
+                            source, destination = y, x
+                    else:
+                        source = PEG_LETTERS.index(symbol[0].upper())
+                        destination = PEG_LETTERS.index(symbol[1].upper())
+                    apply(source, destination)
+                    out.append((source, destination))
+                if len(out) >= CHUNK:
+                    yield from out
+                    out = []
+    yield from out
+
+
+def solution_moves(disks, pegs):
+    """Lazy optimal (3 pegs) or Frame-Stewart solution from the first peg to the last"""
+    return hanoi_moves(disks) if pegs == 3 else frame_stewart_moves(disks, pegs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Export and check Tower of Hanoi move files")
+    commands = parser.add_subparsers(dest="command", required=True)
+    export = commands.add_parser("export", help="stream a solution to a file")
+    export.add_argument("path")
+    export.add_argument("--disks", type=int, default=20)
+    export.add_argument("--pegs", type=int, default=3)
+    export.add_argument("--format", choices=FORMATS, default="bin3")
+    check = commands.add_parser("check", help="decode a file and replay every move")
+    check.add_argument("path")
+    args = parser.parse_args()
+
+    if args.command == "export":
+        count = export_moves(args.path, solution_moves(args.disks, args.pegs),
+                             args.disks, args.pegs, args.format)
+        size = os.path.getsize(args.path)
+        print(f"Wrote {count} moves to {args.path} ({size} bytes, {8 * size / max(count, 1):.3f} bits/move)")
+    else:
+        count = sum(1 for _ in read_moves(args.path))
+        print(f"{args.path}: {count} legal moves")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+"""
+Tower of Hanoi - Generalized Solver
+Author: DSA Project
+Description: Closed-form 3-peg moves and states, Frame-Stewart solutions for k pegs with a memoized split table, optimal 3-peg solving between arbitrary configurations, and BFS for small puzzles
+"""
+
+import functools
+from collections import deque
+
+
+# Closed-form solution: pegs are 0 (A), 1 (B), 2 (C). With 1-based move
+# numbers, move k takes the disk given by k's lowest set bit from peg
+# (k & k-1) % 3 to peg ((k | k-1) + 1) % 3. That moves an odd tower to C and
+# an even one to B, so B and C are swapped for even n.
+def hanoi_move(k, n):
+    """(source, destination) of move k (1-based) of the n-disk solution A -> C"""
+    source = (k & (k - 1)) % 3
+    destination = ((k | (k - 1)) + 1) % 3
+    if n % 2 == 0:
+        swap = (0, 2, 1)
+        return swap[source], swap[destination]
+    return source, destination
+
+
+def hanoi_disk(k):
+    """Disk (1 = smallest) moved by move k: one more than k's trailing zero bits"""
+    return (k & -k).bit_length()
+
+
+def hanoi_moves(n, start=1):
+    """Lazily yield (source, destination) for moves start .. 2^n - 1"""
+    peg = (0, 2, 1) if n % 2 == 0 else (0, 1, 2)
+    for k in range(start, 1 << n):
+        yield peg[(k & (k - 1)) % 3], peg[((k | (k - 1)) + 1) % 3]
+
+
+def hanoi_state(k, n):
+    """Peg contents (bottom to top) after the first k moves, in O(n)"""
+    towers = [[], [], []]
+    source, destination, auxiliary = 0, 2, 1
+    for disk in range(n, 0, -1):
+        half = 1 << (disk - 1)
+        if k < half:
+            # Still moving the smaller disks out of the way onto the auxiliary peg
+            towers[source].append(disk)
+            destination, auxiliary = auxiliary, destination
+        else:
+            # This disk is done; the smaller ones follow it from the auxiliary peg
+            towers[destination].append(disk)
+            k -= half
+            source, auxiliary = auxiliary, source
+    return towers
+
+
+# A configuration is a tuple where config[d] is the peg of disk d (disk 1 is
+# the smallest); index 0 is unused so disk numbers index directly.
+
+
+@functools.lru_cache(maxsize=None)
+def frame_stewart(n, pegs):
+    """(moves, split) for moving n disks with the given number of pegs.
+
+    split is how many of the smallest disks are parked on a spare peg
+    first. The table is shared by every solve in the process.
+    """
+    if n == 0:
+        return 0, 0
+    if n == 1:
+        return 1, 0
+    if pegs == 3:
+        return (1 << n) - 1, n - 1
+    best = None
+    for t in range(1, n):
+        moves = 2 * frame_stewart(t, pegs)[0] + frame_stewart(n - t, pegs - 1)[0]
+        if best is None or moves < best[0]:
+            best = (moves, t)
+    return best
+
+
+def _phases(n, source, target, free):
+    """Split moving n > 1 disks into its three sub-tasks (disks, source, target, free pegs)"""
+    _, t = frame_stewart(n, len(free) + 2)
+    park = free[0]
+    rest = free[1:]
+    # Park the t smallest disks, carry the rest without the parking peg, unpark.
+    # With three pegs this is the classic recursion: t = n - 1 and one plain move.
+    return (
+        (t, source, park, (target,) + rest),
+        (n - t, source, target, rest),
+        (t, park, target, (source,) + rest),
+    )
+
+
+def _free_pegs(pegs, source, target):
+    """Spare pegs for a solve between source and target"""
+    if pegs < 3:
+        raise ValueError("At least three pegs are needed")
+    return tuple(p for p in range(pegs) if p not in (source, target))
+
+
+def frame_stewart_moves(n, pegs=3, source=0, target=None, start=1):
+    """Lazily yield (source, destination) for moves start .. end of the Frame-Stewart solution.
+
+    Resuming at a later move costs one O(n) descent to the sub-task that
+    contains it, not a replay of the earlier moves.
+    """
+    target = pegs - 1 if target is None else target
+    stack = []
+    task = (n, source, target, _free_pegs(pegs, source, target))
+    skip = start - 1
+    while skip and task[0] > 1:
+        phases = _phases(*task)
+        for i, phase in enumerate(phases):
+            cost = frame_stewart(phase[0], len(phase[3]) + 2)[0]
+            if skip < cost:
+                break
+            skip -= cost
+        else:
+            return
+        # The phases after this one still run in full
+        stack.extend(reversed(phases[i + 1:]))
+        task = phase
+    if not skip:
+        stack.append(task)
+
+    while stack:
+        m, s, d, f = stack.pop()
+        if m == 1:
+            yield s, d
+        elif m > 1:
+            stack.extend(reversed(_phases(m, s, d, f)))
+
+
+def frame_stewart_state(index, n, pegs=3, source=0, target=None):
+    """Peg contents (bottom to top) after index moves, by descending the phase structure in O(n)"""
+    target = pegs - 1 if target is None else target
+    place = [source] * (n + 1)
+    offset = 0      # The current sub-task moves disks offset + 1 .. offset + m
+    m, s, d, f = n, source, target, _free_pegs(pegs, source, target)
+    while m > 0:
+        if index == 0 or index >= frame_stewart(m, len(f) + 2)[0]:
+            peg = s if index == 0 else d
+            for disk in range(offset + 1, offset + m + 1):
+                place[disk] = peg
+            break
+        first, middle, last = _phases(m, s, d, f)
+        t = first[0]
+        park_cost = frame_stewart(t, len(f) + 2)[0]
+        carry_cost = frame_stewart(m - t, len(f) + 1)[0]
+        if index < park_cost:
+            # The large disks have not moved yet
+            large = s
+            m, s, d, f = first
+        elif index < park_cost + carry_cost:
+            # The small disks are parked while the large ones travel
+            for disk in range(offset + 1, offset + t + 1):
+                place[disk] = first[2]
+            index -= park_cost
+            offset += t
+            m, s, d, f = middle
+            continue
+        else:
+            # The large disks have arrived; the small ones are unparking
+            large = d
+            index -= park_cost + carry_cost
+            m, s, d, f = last
+        for disk in range(offset + t + 1, offset + t + middle[0] + 1):
+            place[disk] = large
+    return towers_of(place, pegs)
+
+
+def frame_stewart_move(index, n, pegs=3, source=0, target=None):
+    """(source, destination) of move index (1-based), without generating earlier moves"""
+    return next(frame_stewart_moves(n, pegs, source, target, index))
+
+
+def towers_of(place, pegs):
+    """Peg contents (bottom to top) from a disk -> peg configuration"""
+    towers = [[] for _ in range(pegs)]
+    for disk in range(len(place) - 1, 0, -1):
+        towers[place[disk]].append(disk)
+    return towers
+
+
+def config_of(towers):
+    """Disk -> peg configuration tuple from peg contents"""
+    n = sum(len(tower) for tower in towers)
+    place = [0] * (n + 1)
+    for peg, tower in enumerate(towers):
+        for disk in tower:
+            place[disk] = peg
+    return tuple(place)
+
+
+def is_legal(towers):
+    """True if every peg holds its disks largest at the bottom"""
+    return all(all(a > b for a, b in zip(tower, tower[1:])) for tower in towers)
+
+
+def _to_tower_cost(config, m, peg):
+    """Moves to gather disks 1..m from config into a tower on peg (3 pegs)"""
+    cost = 0
+    for disk in range(m, 0, -1):
+        if config[disk] != peg:
+            cost += 1 << (disk - 1)
+            peg = 3 - config[disk] - peg
+    return cost
+
+
+def _to_tower_segments(config, m, peg):
+    """Segments gathering disks 1..m from config into a tower on peg (3 pegs)"""
+    tasks = []
+    for disk in range(m, 0, -1):
+        if config[disk] != peg:
+            other = 3 - config[disk] - peg
+            # After the smaller disks gather on other: move this disk, then bring them over
+            tasks.append((disk, config[disk], peg, other))
+            peg = other
+    # Smallest sub-task first
+    segments = []
+    for disk, source, destination, other in reversed(tasks):
+        segments.append((disk, disk, source, destination))
+        if disk > 1:
+            segments.append((1, disk - 1, other, destination))
+    return segments
+
+
+def _plan_3peg(start, target):
+    """(start config, target config, largest disk to move, cost moving it once, cost moving it twice)"""
+    a, b = config_of(start), config_of(target)
+    if len(a) != len(b):
+        raise ValueError("Start and target hold different disks")
+    m = len(a) - 1
+    while m > 0 and a[m] == b[m]:
+        m -= 1
+    if m == 0:
+        return a, b, 0, 0, 0
+    s, t = a[m], b[m]
+    aux = 3 - s - t
+    once = _to_tower_cost(a, m - 1, aux) + 1 + _to_tower_cost(b, m - 1, aux)
+    twice = _to_tower_cost(a, m - 1, t) + 2 + ((1 << (m - 1)) - 1) + _to_tower_cost(b, m - 1, s)
+    return a, b, m, once, twice
+
+
+def solve_3peg_length(start, target):
+    """Number of moves in the optimal 3-peg solution, without generating it"""
+    _, _, _, once, twice = _plan_3peg(start, target)
+    return min(once, twice)
+
+
+def _segments_3peg(start, target):
+    """Optimal solution as (low, high, source, destination) segments.
+
+    Each segment is the standard transfer of disks low..high between two
+    pegs (2^(high - low + 1) - 1 moves, a single move when low == high),
+    so a solution of any length is described by O(n) segments.
+    """
+    a, b, m, once, twice = _plan_3peg(start, target)
+    if m == 0:
+        return []
+    s, t = a[m], b[m]
+    aux = 3 - s - t
+    if once <= twice:
+        return (_to_tower_segments(a, m - 1, aux) + [(m, m, s, t)]
+                + _reverse(_to_tower_segments(b, m - 1, aux)))
+    return (_to_tower_segments(a, m - 1, t) + [(m, m, s, aux), (1, m - 1, t, s), (m, m, aux, t)]
+            + _reverse(_to_tower_segments(b, m - 1, s)))
+
+
+def _reverse(segments):
+    """Undo sequence of a segment list: tower -> configuration from configuration -> tower"""
+    return [(low, high, d, s) for low, high, s, d in reversed(segments)]
+
+
+def solve_3peg_moves(start, target, first=1):
+    """Lazily yield moves first .. end of the optimal 3-peg solution between two configurations.
+
+    Disks already in place at the bottom are left alone. For the largest
+    disk that must move, the cheaper of two plans is used: move it once
+    (smaller disks to the third peg, then out to the target), or move it
+    twice (via the third peg while the smaller disks shuttle), which can
+    win when the smaller disks already sit on the target peg. Resuming at a
+    later move skips whole segments instead of replaying them.
+    """
+    skip = first - 1
+    for low, high, source, destination in _segments_3peg(start, target):
+        cost = (1 << (high - low + 1)) - 1
+        if skip >= cost:
+            skip -= cost
+            continue
+        yield from frame_stewart_moves(high - low + 1, 3, source, destination, skip + 1)
+        skip = 0
+
+
+def solve_3peg_state(index, start, target):
+    """Peg contents after index moves of the optimal 3-peg solution, in O(n) segment steps"""
+    place = list(config_of(start))
+    for low, high, source, destination in _segments_3peg(start, target):
+        size = high - low + 1
+        cost = (1 << size) - 1
+        if index < cost:
+            if index:
+                place[low:high + 1] = config_of(frame_stewart_state(index, size, 3, source, destination))[1:]
+            break
+        place[low:high + 1] = [destination] * size
+        index -= cost
+    return towers_of(place, len(start))
+
+
+def solve_3peg(start, target):
+    """Optimal moves between two legal 3-peg configurations (peg contents lists)"""
+    return list(solve_3peg_moves(start, target))
+
+
+def shortest_path(start, target, max_states=2_000_000):
+    """Fewest moves between two configurations with any number of pegs, by BFS.
+
+    Only practical for small puzzles: the state graph has pegs^n nodes.
+    """
+    pegs = len(start)
+    a, b = config_of(start), config_of(target)
+    if len(a) != len(b):
+        raise ValueError("Start and target hold different disks")
+    if pegs ** (len(a) - 1) > max_states:
+        raise ValueError(f"{pegs}^{len(a) - 1} states are too many to search")
+
+    parent = {a: None}
+    queue = deque([a])
+    while queue:
+        state = queue.popleft()
+        if state == b:
+            break
+        # Top disk of each peg is the smallest disk on it
+        top = [0] * pegs
+        for disk in range(len(state) - 1, 0, -1):
+            top[state[disk]] = disk
+        for s in range(pegs):
+            disk = top[s]
+            if not disk:
+                continue
+            for d in range(pegs):
+                if d != s and (not top[d] or top[d] > disk):
+                    nxt = state[:disk] + (d,) + state[disk + 1:]
+                    if nxt not in parent:
+                        parent[nxt] = (state, s, d)
+                        queue.append(nxt)
+
+    moves = []
+    state = b
+    while parent[state] is not None:
+        state, s, d = parent[state]
+        moves.append((s, d))
+    moves.reverse()
+    return moves
@@ -0,0 +1,192 @@
+"""
+Huffman Coding - Compression Benchmark
+Author: DSA Project
+Description: Measures the Huffman encoder/decoders against zlib, bz2 and lzma on a generated local corpus
+"""
+
+import argparse
+import bz2
+import json
+import lzma
+import platform
+import random
+import sys
+import time
+import tracemalloc
+import zlib
+
+from huffman_codec import encode_bytes, decode_bytes, decode_bytes_canonical, decode_bytes_tree
+
+
+WORDS = (
+    "the of and to in is that it was for on are with as his they be at one have "
+    "this from or had by hot word but what some we can out other were all there "
+    "when up use your how said an each she which do their time if will way about "
+    "many then them write would like so these her long make thing see him two has "
+    "look more day could go come did number sound no most people my over know water"
+).split()
+
+
+def text_corpus(size, rng):
+    """English-like text with Zipf-distributed word frequencies"""
+    weights = [1 / (rank + 1) for rank in range(len(WORDS))]
+    parts = []
+    length = 0
+    while length < size:
+        line = " ".join(rng.choices(WORDS, weights, k=12)) + ".\n"
+        parts.append(line)
+        length += len(line)
+    return "".join(parts).encode("ascii")[:size]
+
+
+def binary_corpus(size, rng):
+    """Structured binary records: little-endian counters, flags and noise"""
+    out = bytearray()
+    counter = 0
+    while len(out) < size:
+        counter += rng.randint(1, 4)
+        out += counter.to_bytes(4, "little")
+        out += bytes((rng.getrandbits(2), 0, 0, rng.getrandbits(8)))
+    return bytes(out[:size])
+
+
+def skewed_corpus(size, rng):
+    """Geometrically distributed byte values (few symbols dominate)"""
+    return bytes(min(int(rng.expovariate(0.35)), 255) for _ in range(size))
+
+
+def uniform_corpus(size, rng):
+    """Uniformly random bytes (incompressible)"""
+    return bytes(rng.getrandbits(8) for _ in range(size))
+
+
+CORPORA = {
+    "text": text_corpus,
+    "binary": binary_corpus,
+    "skewed": skewed_corpus,
+    "uniform": uniform_corpus,
+}
+
+# The Huffman variants share an encoder and differ only in the decoder:
+# byte-at-a-time state machine, canonical tables, and bitwise tree walk
+CODECS = {
+    "huffman": (encode_bytes, decode_bytes),
+    "huff-can": (encode_bytes, decode_bytes_canonical),
+    "huff-tree": (encode_bytes, decode_bytes_tree),
+    "zlib": (lambda d: zlib.compress(d, 6), zlib.decompress),
+    "bz2": (lambda d: bz2.compress(d, 9), bz2.decompress),
+    "lzma": (lambda d: lzma.compress(d, preset=6), lzma.decompress),
+}
+
+
+def best_time(func, arg, repeat):
+    """Fastest wall time of several runs, with the last result"""
+    best = None
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = func(arg)
+        elapsed = time.perf_counter() - start
+        if best is None or elapsed < best:
+            best = elapsed
+    return best, result
+
+
+def peak_memory(func, arg):
+    """Peak Python heap allocation during one call, in bytes"""
+    tracemalloc.start()
+    try:
+        func(arg)
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def run_benchmark(size, repeat, seed, codecs):
+    """Benchmark every codec on every corpus; returns a list of result rows"""
+    results = []
+    for corpus_name, generate in CORPORA.items():
+        data = generate(size, random.Random(seed))
+        mb = len(data) / (1024 * 1024)
+        for codec_name in codecs:
+            compress, decompress = CODECS[codec_name]
+            enc_time, encoded = best_time(compress, data, repeat)
+            dec_time, decoded = best_time(decompress, encoded, repeat)
+            if decoded != data:
+                raise RuntimeError(f"{codec_name} failed to round-trip the {corpus_name} corpus")
+            results.append({
+                "corpus": corpus_name,
+                "codec": codec_name,
+                "input_bytes": len(data),
+                "output_bytes": len(encoded),
+                "ratio": len(encoded) / len(data),
+                "encode_mb_s": mb / enc_time if enc_time else float("inf"),
+                "decode_mb_s": mb / dec_time if dec_time else float("inf"),
+                "encode_peak_bytes": peak_memory(compress, data),
+                "decode_peak_bytes": peak_memory(decompress, encoded),
+            })
+    return results
+
+
+def print_results(results, baseline=None):
+    """Print a table, with speed change vs. a baseline run when given"""
+    previous = {}
+    if baseline:
+        previous = {(r["corpus"], r["codec"]): r for r in baseline["results"]}
+
+    header = f"{'corpus':<8} {'codec':<9} {'ratio':>7} {'enc MB/s':>9} {'dec MB/s':>9} {'enc peak':>10} {'dec peak':>10}"
+    if previous:
+        header += f" {'enc Δ':>8} {'dec Δ':>8}"
+    print(header)
+    print("-" * len(header))
+
+    for r in results:
+        line = (
+            f"{r['corpus']:<8} {r['codec']:<9} {r['ratio']:>7.3f} "
+            f"{r['encode_mb_s']:>9.2f} {r['decode_mb_s']:>9.2f} "
+            f"{r['encode_peak_bytes'] // 1024:>8}KB {r['decode_peak_bytes'] // 1024:>8}KB"
+        )
+        old = previous.get((r["corpus"], r["codec"]))
+        if old:
+            enc_delta = (r["encode_mb_s"] / old["encode_mb_s"] - 1) * 100
+            dec_delta = (r["decode_mb_s"] / old["decode_mb_s"] - 1) * 100
+            line += f" {enc_delta:>+7.1f}% {dec_delta:>+7.1f}%"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark Huffman coding against stdlib compressors")
+    parser.add_argument("--size", type=int, default=256 * 1024, help="bytes per corpus (default 256 KiB)")
+    parser.add_argument("--repeat", type=int, default=3, help="timing runs per measurement")
+    parser.add_argument("--seed", type=int, default=2024, help="corpus generator seed")
+    parser.add_argument("--codecs", nargs="+", default=list(CODECS), choices=list(CODECS))
+    parser.add_argument("--label", default="", help="free-form label stored with the results")
+    parser.add_argument("--output", help="write results to this JSON file")
+    parser.add_argument("--baseline", help="earlier JSON results to compare against")
+    args = parser.parse_args()
+
+    baseline = None
+    if args.baseline:
+        with open(args.baseline, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    results = run_benchmark(args.size, args.repeat, args.seed, args.codecs)
+    print_results(results, baseline)
+
+    if args.output:
+        report = {
+            "label": args.label,
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": sys.version.split()[0],
+            "platform": platform.platform(),
+            "size": args.size,
+            "seed": args.seed,
+            "results": results,
+        }
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
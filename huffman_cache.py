@@ -0,0 +1,166 @@
+"""
+Huffman Codebook Cache
+Author: DSA Project
+Description: Persistent on-disk cache of canonical Huffman codebooks keyed by a quantized frequency-histogram fingerprint
+"""
+
+import hashlib
+import json
+import math
+import os
+import time
+
+
+class CodebookCache:
+    """Stores canonical code lengths so similar histograms can skip the tree build.
+
+    Histograms are normalized and quantized before hashing, so inputs whose
+    symbol probabilities differ only slightly share a fingerprint. A cached
+    codebook is reused only if its estimated compression loss on the new
+    histogram stays under max_loss percent.
+    """
+
+    def __init__(self, directory=None, max_bytes=16 * 1024 * 1024,
+                 max_age=30 * 24 * 3600, quantize_bits=8, max_loss=1.0):
+        if directory is None:
+            directory = os.path.join(os.path.expanduser("~"), ".cache", "dsa_huffman")
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.quantize_bits = quantize_bits
+        self.max_loss = max_loss
+
+    def fingerprint(self, freq_map):
+        """Hash of the histogram with probabilities rounded to 2^-quantize_bits, or None if it has no weight"""
+        total = sum(freq_map.values())
+        if total <= 0:
+            return None
+        scale = 1 << self.quantize_bits
+        quantized = sorted(
+            (repr(symbol), round(freq * scale / total)) for symbol, freq in freq_map.items()
+        )
+        return hashlib.sha256(json.dumps(quantized).encode("utf-8")).hexdigest()
+
+    def entry_path(self, key):
+        return os.path.join(self.directory, f"{key}.json")
+
+    def lookup(self, freq_map):
+        """Return (lengths, loss_percent) for a reusable codebook, or None"""
+        key = self.fingerprint(freq_map) if freq_map else None
+        if key is None:
+            return None
+        path = self.entry_path(key)
+        try:
+            if time.time() - os.stat(path).st_mtime > self.max_age:
+                self.remove(path)
+                return None
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+
+        lengths = {symbol: length for symbol, length in entry["lengths"]}
+        if any(symbol not in lengths for symbol in freq_map):
+            return None
+
+        loss = self.estimate_loss(freq_map, lengths, entry.get("redundancy", 0.0))
+        if loss > self.max_loss:
+            return None
+
+        # Refresh the access time so size-based eviction drops cold entries first
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return lengths, loss
+
+    def estimate_loss(self, freq_map, lengths, redundancy):
+        """Percent by which the cached code exceeds the estimated optimum.
+
+        The optimum is estimated as the new histogram's entropy plus the
+        redundancy the cached code had on the histogram it was built for.
+        """
+        avg_length, entropy = self.code_summary(freq_map, lengths)
+        optimum = entropy + redundancy
+        if optimum <= 0:
+            return 0.0
+        return max(0.0, (avg_length - optimum) / optimum * 100)
+
+    @staticmethod
+    def code_summary(freq_map, lengths):
+        """Average code length and entropy (bits/symbol) of a histogram"""
+        total = sum(freq_map.values())
+        if total == 0:
+            return 0.0, 0.0
+        avg_length = sum(freq * lengths[symbol] for symbol, freq in freq_map.items()) / total
+        entropy = -sum((f / total) * math.log2(f / total) for f in freq_map.values() if f > 0)
+        return avg_length, entropy
+
+    def store(self, freq_map, lengths):
+        """Save the code lengths built for freq_map, then enforce the limits"""
+        key = self.fingerprint(freq_map) if freq_map else None
+        if key is None:
+            return
+        avg_length, entropy = self.code_summary(freq_map, lengths)
+        entry = {
+            "version": 1,
+            "redundancy": avg_length - entropy,
+            "lengths": sorted(([symbol, length] for symbol, length in lengths.items()),
+                              key=lambda item: (item[1], repr(item[0])))
+        }
+
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            path = self.entry_path(key)
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(entry, f, separators=(",", ":"))
+            os.replace(tmp_path, path)
+        except OSError:
+            return
+        self.evict()
+
+    def evict(self):
+        """Drop entries unused for max_age, then the least recently used beyond max_bytes"""
+        try:
+            names = [name for name in os.listdir(self.directory) if name.endswith(".json")]
+        except OSError:
+            return
+
+        now = time.time()
+        entries = []
+        for name in names:
+            path = os.path.join(self.directory, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            if now - st.st_mtime > self.max_age:
+                self.remove(path)
+            else:
+                entries.append((st.st_mtime, st.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            self.remove(path)
+            total -= size
+
+    def clear(self):
+        """Remove every cached codebook"""
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return
+        for name in names:
+            if name.endswith(".json"):
+                self.remove(os.path.join(self.directory, name))
+
+    @staticmethod
+    def remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
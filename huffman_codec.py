@@ -0,0 +1,277 @@
+"""
+Huffman Coding - Codec
+Author: DSA Project
+Description: Huffman code construction, canonical codes and the byte-stream encoder and decoders, free of any GUI dependency
+"""
+
+import collections
+import functools
+
+class HuffmanNode:
+    __slots__ = ('char', 'freq', 'left', 'right')
+    
+    def __init__(self, char, freq):
+        self.char = char
+        self.freq = freq
+        self.left = None
+        self.right = None
+        
+    def __lt__(self, other):
+        return self.freq < other.freq
+
+def canonical_codes(lengths):
+    """Assign canonical Huffman codes from a symbol -> code length map"""
+    codes = {}
+    code = 0
+    prev_length = 0
+    for symbol, length in sorted(lengths.items(), key=lambda item: (item[1], item[0])):
+        code <<= length - prev_length
+        codes[symbol] = format(code, f"0{length}b")
+        code += 1
+        prev_length = length
+    return codes
+
+def tree_from_codes(codes, freq_map):
+    """Rebuild a Huffman tree from a prefix code, weighting nodes by freq_map"""
+    root = HuffmanNode(None, 0)
+    for symbol, code in codes.items():
+        node = root
+        for bit in code:
+            child = node.left if bit == "0" else node.right
+            if child is None:
+                child = HuffmanNode(None, 0)
+                if bit == "0":
+                    node.left = child
+                else:
+                    node.right = child
+            node = child
+        node.char = symbol
+        node.freq = freq_map.get(symbol, 0)
+        
+    # Internal weights are the sums of their leaves
+    order = []
+    stack = [root]
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        stack.extend(child for child in (node.left, node.right) if child is not None)
+    for node in reversed(order):
+        if node.char is None:
+            node.freq = sum(child.freq for child in (node.left, node.right) if child is not None)
+    return root
+
+def huffman_code_lengths(freq_map):
+    """Optimal code length per symbol, built over parallel index arrays.
+
+    Uses the two-queue method: after one sort, merged weights come out in
+    non-decreasing order, so each merge only compares the fronts of the
+    sorted leaves and the merged nodes. No node objects or heap are needed,
+    which keeps alphabets with millions of symbols cheap.
+    """
+    symbols = list(freq_map)
+    n = len(symbols)
+    if n == 0:
+        return {}
+    if n == 1:
+        return {symbols[0]: 1}
+        
+    weights = [freq_map[symbol] for symbol in symbols]
+    order = sorted(range(n), key=weights.__getitem__)
+    leaf_weight = [weights[i] for i in order]
+    leaf_weight.append(float("inf"))
+    merged_weight = []
+    
+    # Ids 0..n-1 are leaves in sorted order, n.. are merged nodes; every
+    # parent id is larger than its children's
+    parent = [0] * (2 * n - 1)
+    leaf = merged = 0
+    for node in range(n, 2 * n - 1):
+        weight = 0
+        for _ in range(2):
+            if merged < len(merged_weight) and merged_weight[merged] < leaf_weight[leaf]:
+                parent[n + merged] = node
+                weight += merged_weight[merged]
+                merged += 1
+            else:
+                parent[leaf] = node
+                weight += leaf_weight[leaf]
+                leaf += 1
+        merged_weight.append(weight)
+        
+    depth = [0] * (2 * n - 1)
+    for i in range(2 * n - 3, -1, -1):
+        depth[i] = depth[parent[i]] + 1
+    return {symbols[order[i]]: depth[i] for i in range(n)}
+
+def pack_codes(symbols, codes, chunk_size=65536):
+    """Concatenate the codes of a symbol sequence into bytes, zero-padding the last byte"""
+    out = bytearray()
+    pending = ""
+    for start in range(0, len(symbols), chunk_size):
+        bits = pending + "".join(map(codes.__getitem__, symbols[start:start + chunk_size]))
+        whole = len(bits) - len(bits) % 8
+        if whole:
+            out += int(bits[:whole], 2).to_bytes(whole // 8, "big")
+        pending = bits[whole:]
+    if pending:
+        out += int(pending.ljust(8, "0"), 2).to_bytes(1, "big")
+    return out
+
+def canonical_table(lengths):
+    """Decoding tables for a canonical code.
+
+    Returns (symbols in code order, count per length, first code per length,
+    index of the first symbol per length).
+    """
+    ordered = sorted(lengths, key=lambda symbol: (lengths[symbol], symbol))
+    max_length = lengths[ordered[-1]] if ordered else 0
+    count = [0] * (max_length + 1)
+    for symbol in ordered:
+        count[lengths[symbol]] += 1
+        
+    first_code = [0] * (max_length + 1)
+    first_index = [0] * (max_length + 1)
+    for length in range(1, max_length + 1):
+        first_code[length] = (first_code[length - 1] + count[length - 1]) << 1
+        first_index[length] = first_index[length - 1] + count[length - 1]
+    return ordered, count, first_code, first_index
+
+def decode_canonical(payload, n_symbols, table):
+    """Decode n_symbols from a canonical-code bit stream using per-length tables"""
+    ordered, count, first_code, first_index = table
+    max_length = len(count) - 1
+    out = []
+    if n_symbols == 0:
+        return out
+        
+    code = 0
+    length = 0
+    for byte in payload:
+        for shift in range(7, -1, -1):
+            code = (code << 1) | ((byte >> shift) & 1)
+            length += 1
+            offset = code - first_code[length]
+            if offset < count[length]:
+                out.append(ordered[first_index[length] + offset])
+                if len(out) == n_symbols:
+                    return out
+                code = 0
+                length = 0
+            elif length == max_length:
+                raise ValueError("Corrupt Huffman stream")
+    raise ValueError("Huffman stream ended early")
+
+HEADER_MAGIC = b"HUF1"
+
+def encode_bytes(data, chunk_size=65536):
+    """Huffman-compress bytes.
+
+    Layout: magic, original length (8 bytes), 256 code lengths (one byte
+    each, 0 for unused bytes), then the canonical-code bit stream.
+    """
+    lengths = huffman_code_lengths(collections.Counter(data))
+    codes = canonical_codes(lengths)
+    table = [codes.get(b, "") for b in range(256)]
+    
+    out = bytearray(HEADER_MAGIC)
+    out += len(data).to_bytes(8, "big")
+    out += bytes(lengths.get(b, 0) for b in range(256))
+    out += pack_codes(data, table, chunk_size)
+    return bytes(out)
+
+def read_header(blob):
+    """Split an encoded blob into (original length, code lengths, payload)"""
+    if blob[:4] != HEADER_MAGIC:
+        raise ValueError("Not a Huffman-encoded stream")
+    size = int.from_bytes(blob[4:12], "big")
+    lengths = {b: length for b, length in enumerate(blob[12:268]) if length}
+    return size, lengths, blob[268:]
+
+def decode_bytes_tree(blob):
+    """Decode by walking the code tree one bit at a time"""
+    size, lengths, payload = read_header(blob)
+    out = bytearray()
+    if size == 0:
+        return bytes(out)
+        
+    root = tree_from_codes(canonical_codes(lengths), {})
+    node = root
+    for byte in payload:
+        for shift in range(7, -1, -1):
+            node = node.right if (byte >> shift) & 1 else node.left
+            if node.char is not None:
+                out.append(node.char)
+                if len(out) == size:
+                    return bytes(out)
+                node = root
+    return bytes(out)
+
+def decode_bytes_canonical(blob):
+    """Decode bit by bit against the canonical first-code/count tables"""
+    size, lengths, payload = read_header(blob)
+    if size == 0:
+        return b""
+    return bytes(decode_canonical(payload, size, canonical_table(lengths)))
+
+@functools.lru_cache(maxsize=32)
+def compile_decoder_fsm(length_items):
+    """Compile a byte-alphabet canonical code into a byte-at-a-time state machine.
+
+    length_items is a sorted tuple of (byte, code length) pairs, so the
+    tables are built once per codebook and reused from the cache. States
+    are the internal nodes of the code tree (0 is the root). Entry
+    state * 256 + input_byte of the returned lists holds the next state,
+    pre-multiplied by 256, and the bytes emitted while consuming the input
+    byte. One extra dead state absorbs bit patterns that are not codes.
+    """
+    # Code tree as child arrays; leaves are stored as -1 - symbol
+    children = [[None, None]]
+    for symbol, code in canonical_codes(dict(length_items)).items():
+        node = 0
+        for bit in code[:-1]:
+            b = int(bit)
+            if children[node][b] is None:
+                children[node][b] = len(children)
+                children.append([None, None])
+            node = children[node][b]
+        children[node][int(code[-1])] = -1 - symbol
+        
+    dead = len(children)
+    next_state = [dead * 256] * ((dead + 1) * 256)
+    emitted = [b""] * ((dead + 1) * 256)
+    for state in range(dead):
+        for byte in range(256):
+            node = state
+            out = bytearray()
+            for shift in range(7, -1, -1):
+                child = children[node][(byte >> shift) & 1]
+                if child is None:
+                    node = dead
+                    break
+                if child < 0:
+                    out.append(-1 - child)
+                    node = 0
+                else:
+                    node = child
+            next_state[state * 256 + byte] = node * 256
+            emitted[state * 256 + byte] = bytes(out)
+    return next_state, emitted
+
+def decode_bytes(blob):
+    """Decode one input byte per transition with a cached state machine"""
+    size, lengths, payload = read_header(blob)
+    if size == 0:
+        return b""
+        
+    next_state, emitted = compile_decoder_fsm(tuple(sorted(lengths.items())))
+    out = bytearray()
+    state = 0
+    for byte in payload:
+        i = state + byte
+        out += emitted[i]
+        state = next_state[i]
+        
+    # The final byte's padding may decode to extra symbols
+    if len(out) < size:
+        raise ValueError("Corrupt or truncated Huffman stream")
+    return bytes(out[:size])
@@ -7,17 +7,11 @@ Description: Interactive visualization of Huffman Coding algorithm with tree con
 import tkinter as tk
 from tkinter import ttk
 import heapq
-import collections
-
-class HuffmanNode:
-    def __init__(self, char, freq):
-        self.char = char
-        self.freq = freq
-        self.left = None
-        self.right = None
-        
-    def __lt__(self, other):
-        return self.freq < other.freq
+import math
+from tree_layout import cached_layout, subtree_extents
+from huffman_cache import CodebookCache
+from huffman_codec import HuffmanNode, canonical_codes, tree_from_codes
+from huffman_model import tokenize, build_model
 
 class HuffmanCoding:
     def __init__(self, root):
@@ -30,9 +24,20 @@ class HuffmanCoding:
         self.nodes = []
         self.huffman_tree = None
         self.codes = {}
-        self.node_positions = {}
+        self.freq_map = {}
+        self.code_stats = None
+        self.table_batch_size = 200
+        self.codebook_cache = CodebookCache()
+        self.layout = {}
+        self.extents = {}
+        self.root_offsets = {}
+        self.x_unit = 60
+        self.level_height = 80
+        self.margin = 50
         self.animation_step = 0
+        self.leaves = []
         self.steps = []
+        self.forest = {}
         self.is_animating = False
         self.zoom_scale = 1.0
         
@@ -83,9 +88,24 @@ class HuffmanCoding:
         )
         input_group.pack(fill=tk.X, pady=5)
         
+        self.model_modes = {
+            "Symbol frequencies": None,
+            "Words": ("words", 0),
+            "Byte 2-grams": ("ngrams", 2),
+            "Byte 3-grams": ("ngrams", 3)
+        }
+        self.model_box = ttk.Combobox(
+            input_group,
+            values=list(self.model_modes),
+            state="readonly",
+            width=20
+        )
+        self.model_box.current(0)
+        self.model_box.pack(anchor=tk.W, pady=2)
+        
         tk.Label(
             input_group,
-            text="Format: char:freq (comma separated)",
+            text="Format: char:freq (comma separated), or plain text for word/n-gram models",
             bg=self.colors['bg'],
             fg="#a6adc8",
             font=("Arial", 9),
@@ -130,6 +150,19 @@ class HuffmanCoding:
         )
         self.reset_btn.pack(fill=tk.X, pady=2)
         
+        # Off by default: a cache hit skips the step-by-step merge animation
+        self.use_cache = tk.BooleanVar(value=False)
+        tk.Checkbutton(
+            btn_frame,
+            text="Reuse cached codebooks",
+            variable=self.use_cache,
+            font=("Arial", 9),
+            bg=self.colors['bg'],
+            fg=self.colors['text'],
+            selectcolor="#313244",
+            activebackground=self.colors['bg']
+        ).pack(anchor=tk.W, pady=2)
+        
         # Zoom Controls
         zoom_frame = tk.Frame(left_frame, bg=self.colors['bg'])
         zoom_frame.pack(fill=tk.X, pady=5)
@@ -243,6 +276,10 @@ class HuffmanCoding:
 
     def parse_input(self):
         """Parse input string into frequency map"""
+        mode = self.model_modes.get(self.model_box.get())
+        if mode is not None:
+            return self.parse_tokens(*mode)
+            
         try:
             text = self.input_entry.get()
             pairs = [p.strip() for p in text.split(',')]
@@ -255,142 +292,199 @@ class HuffmanCoding:
             self.step_label.config(text=f"Error: Invalid input format", fg="#f38ba8")
             return None
 
+    def parse_tokens(self, mode, n):
+        """Tokenize the input text into words or byte n-grams and count them"""
+        data = self.input_entry.get().encode("utf-8")
+        if not data:
+            self.step_label.config(text="Error: Enter some text to model", fg="#f38ba8")
+            return None
+            
+        token_freqs, _ = build_model(tokenize(data, mode, n))
+        freq_map = {}
+        for token, freq in token_freqs.items():
+            label = token.decode("utf-8", "replace").replace(" ", "·").replace("\n", "↵")
+            freq_map[label] = freq_map.get(label, 0) + freq
+        return freq_map
+
     def build_huffman_tree(self, freq_map):
-        """Build Huffman tree and record steps"""
-        heap = [HuffmanNode(char, freq) for char, freq in freq_map.items()]
+        """Build Huffman tree and record steps as merge deltas"""
+        leaves = [HuffmanNode(char, freq) for char, freq in freq_map.items()]
+        
+        # (freq, order, node) entries keep ties deterministic without node compares
+        heap = [(node.freq, i, node) for i, node in enumerate(leaves)]
         heapq.heapify(heap)
+        order = len(heap)
         
+        # Each step is (left, right, merged): the forest before step k is the
+        # leaves with the first k merges applied, so no snapshots are stored
         steps = []
-        # Initial state
-        steps.append({
-            'nodes': [n for n in heap],
-            'msg': "Initial priority queue of nodes"
-        })
         
         while len(heap) > 1:
             # Get two smallest nodes
-            left = heapq.heappop(heap)
-            right = heapq.heappop(heap)
+            left = heapq.heappop(heap)[2]
+            right = heapq.heappop(heap)[2]
             
             # Create internal node
             merged = HuffmanNode(None, left.freq + right.freq)
             merged.left = left
             merged.right = right
             
-            heapq.heappush(heap, merged)
+            heapq.heappush(heap, (merged.freq, order, merged))
+            order += 1
+            steps.append((left, right, merged))
             
-            # Record step
-            steps.append({
-                'nodes': [n for n in heap],
-                'msg': f"Merged nodes with freq {left.freq} and {right.freq} into new node {merged.freq}"
-            })
-            
-        return heap[0], steps
+        return heap[0][2], leaves, steps
+
+    def step_message(self, step):
+        """Describe a merge step"""
+        left, right, merged = step
+        return f"Merged nodes with freq {left.freq} and {right.freq} into new node {merged.freq}"
+
+    def apply_step(self, step):
+        """Apply a merge delta to the current forest"""
+        left, right, merged = step
+        del self.forest[left]
+        del self.forest[right]
+        self.forest[merged] = None
 
     def generate_codes(self, node, code=""):
-        """Generate Huffman codes recursively"""
+        """Generate Huffman codes (explicit stack, safe for deep trees)"""
         if node is None:
             return
             
-        if node.char is not None:
-            self.codes[node.char] = code
-            return
-            
-        self.generate_codes(node.left, code + "0")
-        self.generate_codes(node.right, code + "1")
+        stack = [(node, code)]
+        while stack:
+            node, code = stack.pop()
+            if node.char is not None:
+                # A lone symbol still needs a one-bit code
+                self.codes[node.char] = code or "0"
+                continue
+            stack.append((node.right, code + "1"))
+            stack.append((node.left, code + "0"))
 
-    def calculate_positions(self, node, x, y, level, width):
-        """Calculate tree node positions"""
-        if node is None:
-            return
-            
-        self.node_positions[node] = (x, y)
-        
-        if node.left or node.right:
-            dx = width / (2 ** (level + 2))
-            self.calculate_positions(node.left, x - dx, y + 80, level + 1, width)
-            self.calculate_positions(node.right, x + dx, y + 80, level + 1, width)
+    def place_forest(self, roots):
+        """Pack forest roots left to right; returns root -> unzoomed (ox, oy) offset"""
+        offsets = {}
+        cursor = self.margin
+        for node in roots:
+            lo, hi = self.extents[node]
+            offsets[node] = (
+                cursor - lo * self.x_unit,
+                self.margin - self.layout[node][1] * self.level_height
+            )
+            cursor += (hi - lo + 1) * self.x_unit
+        return offsets
+
+    def node_xy(self, node, offset):
+        """Canvas position of a node drawn under a root offset"""
+        x, depth = self.layout[node]
+        ox, oy = offset
+        return (ox + x * self.x_unit) * self.zoom_scale, (oy + depth * self.level_height) * self.zoom_scale
+
+    def draw_edges(self, node, offset, tag):
+        """Draw the edges from a node to its children; returns the line items"""
+        x, y = self.node_xy(node, offset)
+        lines = []
+        for child, bit, sign in ((node.left, "0", -1), (node.right, "1", 1)):
+            if child is None:
+                continue
+            cx, cy = self.node_xy(child, offset)
+            lines.append(self.canvas.create_line(
+                x, y, cx, cy, fill=self.colors['edge'], width=2 * self.zoom_scale, tags=tag
+            ))
+            self.canvas.create_text(
+                (x + cx) / 2 + sign * 10 * self.zoom_scale, (y + cy) / 2,
+                text=bit, fill="#fab387", font=("Arial", int(10*self.zoom_scale), "bold"), tags=tag
+            )
+        return lines
+
+    def draw_node(self, node, offset, tag):
+        """Draw a node circle and its label"""
+        x, y = self.node_xy(node, offset)
+        color = self.colors['leaf'] if node.char is not None else self.colors['node']
+        text = f"{node.char}:{node.freq}" if node.char is not None else str(node.freq)
+        
+        r = 25 * self.zoom_scale
+        self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=color, outline=self.colors['text'], tags=tag)
+        self.canvas.create_text(x, y, text=text, fill="#1e1e2e", font=("Arial", int(10*self.zoom_scale), "bold"), tags=tag)
 
     def draw_tree(self, nodes_to_draw):
-        """Draw the current state of the forest/tree"""
+        """Draw the current state of the forest/tree from scratch"""
         self.canvas.delete("all")
-        self.node_positions = {}
-        
-        # Calculate positions for forest
-        canvas_width = self.canvas.winfo_width()
-        # Adjust section width based on zoom, but keep relative layout logic
-        # Ideally, we want the whole drawing to scale.
-        # Let's calculate base positions then scale them.
-        
-        section_width = (canvas_width / len(nodes_to_draw)) 
-        
-        for i, node in enumerate(nodes_to_draw):
-            x = (i * section_width) + (section_width / 2)
-            self.calculate_positions(node, x, 50, 0, section_width * 2)
-            
-        # Draw edges
-        for node in self.node_positions:
-            x, y = self.node_positions[node]
-            # Apply zoom
-            x *= self.zoom_scale
-            y *= self.zoom_scale
+        self.root_offsets = self.place_forest(nodes_to_draw)
+        
+        # Every item is tagged with its forest root so a merge can move the
+        # whole subtree with a single canvas call
+        for root_node, offset in self.root_offsets.items():
+            tag = f"sub_{id(root_node)}"
+            subtree = []
+            stack = [root_node]
+            while stack:
+                node = stack.pop()
+                subtree.append(node)
+                self.draw_edges(node, offset, tag)
+                for child in (node.left, node.right):
+                    if child is not None:
+                        stack.append(child)
+            for node in subtree:
+                self.draw_node(node, offset, tag)
             
-            if node.left:
-                lx, ly = self.node_positions[node.left]
-                lx *= self.zoom_scale
-                ly *= self.zoom_scale
-                
-                self.canvas.create_line(x, y, lx, ly, fill=self.colors['edge'], width=2 * self.zoom_scale)
-                # Label 0
-                self.canvas.create_text((x+lx)/2 - 10*self.zoom_scale, (y+ly)/2, text="0", fill="#fab387", font=("Arial", int(10*self.zoom_scale), "bold"))
-                
-            if node.right:
-                rx, ry = self.node_positions[node.right]
-                rx *= self.zoom_scale
-                ry *= self.zoom_scale
-                
-                self.canvas.create_line(x, y, rx, ry, fill=self.colors['edge'], width=2 * self.zoom_scale)
-                # Label 1
-                self.canvas.create_text((x+rx)/2 + 10*self.zoom_scale, (y+ry)/2, text="1", fill="#fab387", font=("Arial", int(10*self.zoom_scale), "bold"))
+        self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
-        # Draw nodes
-        for node, (bx, by) in self.node_positions.items():
-            x = bx * self.zoom_scale
-            y = by * self.zoom_scale
-            
-            color = self.colors['leaf'] if node.char else self.colors['node']
-            text = f"{node.char}:{node.freq}" if node.char else str(node.freq)
-            
-            # Node circle
-            r = 25 * self.zoom_scale
-            self.canvas.create_oval(x-r, y-r, x+r, y+r, fill=color, outline=self.colors['text'])
-            self.canvas.create_text(x, y, text=text, fill="#1e1e2e", font=("Arial", int(10*self.zoom_scale), "bold"))
+    def draw_merge(self, step):
+        """Update the canvas for one merge: move the affected subtrees and add the parent"""
+        left, right, merged = step
+        offsets = self.place_forest(self.forest)
+        tag = f"sub_{id(merged)}"
+        nx, ny = offsets[merged]
+        
+        for child in (left, right):
+            ox, oy = self.root_offsets.pop(child)
+            child_tag = f"sub_{id(child)}"
+            self.canvas.move(child_tag, (nx - ox) * self.zoom_scale, (ny - oy) * self.zoom_scale)
+            self.canvas.addtag_withtag(tag, child_tag)
             
+        for line in self.draw_edges(merged, offsets[merged], tag):
+            self.canvas.tag_lower(line)
+        self.draw_node(merged, offsets[merged], tag)
+        
+        # Other roots only shift sideways when the packing changes
+        for node, (nx, ny) in offsets.items():
+            old = self.root_offsets.get(node)
+            if old is not None and old != (nx, ny):
+                self.canvas.move(f"sub_{id(node)}", (nx - old[0]) * self.zoom_scale, (ny - old[1]) * self.zoom_scale)
+        self.root_offsets = offsets
+        
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def redraw(self):
+        """Redraw the forest or finished tree at the current zoom"""
+        if self.is_animating and self.forest:
+            self.draw_tree(list(self.forest))
+        elif self.huffman_tree:
+            self.draw_tree([self.huffman_tree])
+
     def zoom_in(self):
         self.zoom_scale *= 1.1
-        if self.animation_step > 0 and self.steps:
-             # Redraw current step
-             step = self.steps[self.animation_step - 1]
-             self.draw_tree(step['nodes'])
-        elif self.huffman_tree:
-             self.draw_tree([self.huffman_tree])
+        self.redraw()
 
     def zoom_out(self):
         self.zoom_scale /= 1.1
-        if self.animation_step > 0 and self.steps:
-             step = self.steps[self.animation_step - 1]
-             self.draw_tree(step['nodes'])
-        elif self.huffman_tree:
-             self.draw_tree([self.huffman_tree])
+        self.redraw()
 
     def animate_step(self):
         """Animate one step of construction"""
-        if self.animation_step < len(self.steps):
-            step = self.steps[self.animation_step]
-            self.draw_tree(step['nodes'])
-            self.step_label.config(text=step['msg'])
+        if self.animation_step == 0:
+            self.forest = dict.fromkeys(self.leaves)
+            self.draw_tree(list(self.forest))
+            self.step_label.config(text="Initial priority queue of nodes")
+            self.animation_step += 1
+            self.root.after(1500, self.animate_step)
+        elif self.animation_step <= len(self.steps):
+            step = self.steps[self.animation_step - 1]
+            self.apply_step(step)
+            self.draw_merge(step)
+            self.step_label.config(text=self.step_message(step))
             self.animation_step += 1
             self.root.after(1500, self.animate_step)
         else:
@@ -398,42 +492,70 @@ class HuffmanCoding:
             self.step_label.config(text="Huffman Tree Construction Complete!", fg="#a6e3a1")
             self.update_table()
 
+    def compute_stats(self, freq_map, codes):
+        """Compute code-length and bit statistics once per built tree"""
+        total_freq = sum(freq_map.values())
+        total_bits = 0
+        entropy = 0.0
+        rows = []
+        
+        for char, code in sorted(codes.items()):
+            freq = freq_map[char]
+            total_bits += len(code) * freq
+            if freq > 0:
+                p = freq / total_freq
+                entropy -= p * math.log2(p)
+            rows.append((char, freq, code, len(code)))
+            
+        original_bits = 8 * total_freq  # Assuming 8-bit ASCII
+        avg_length = total_bits / total_freq if total_freq > 0 else 0
+        
+        return {
+            'rows': rows,
+            'total_bits': total_bits,
+            'original_bits': original_bits,
+            'entropy': entropy,
+            'avg_length': avg_length,
+            'efficiency': (entropy / avg_length) * 100 if avg_length > 0 else 100.0,
+            'compression': (1 - total_bits / original_bits) * 100 if original_bits > 0 else 0
+        }
+
     def update_table(self):
         """Update the encoding table and stats"""
         # Clear table
         for item in self.tree_view.get_children():
             self.tree_view.delete(item)
             
-        # Generate codes
-        self.codes = {}
-        self.generate_codes(self.huffman_tree)
-        
-        # Calculate stats
-        total_bits = 0
-        original_bits = 0
-        
-        for char, code in sorted(self.codes.items()):
-            freq = 0
-            # Find freq from input
-            freq_map = self.parse_input()
-            if freq_map:
-                freq = freq_map[char]
-                
-            bits = len(code) * freq
-            total_bits += bits
-            original_bits += 8 * freq  # Assuming 8-bit ASCII
-            
-            self.tree_view.insert('', 'end', values=(char, freq, code, len(code)))
+        stats = self.code_stats
+        if stats is None:
+            return
             
+        # Populate rows in batches so large alphabets don't block the UI
+        self.insert_table_rows(stats['rows'], 0)
+        
         # Update stats label
-        compression = (1 - total_bits/original_bits) * 100 if original_bits > 0 else 0
         stats_text = (
-            f"Original Size: {original_bits} bits\n"
-            f"Compressed Size: {total_bits} bits\n"
-            f"Compression Ratio: {compression:.1f}%"
+            f"Original Size: {stats['original_bits']} bits\n"
+            f"Compressed Size: {stats['total_bits']} bits\n"
+            f"Compression Ratio: {stats['compression']:.1f}%\n"
+            f"Entropy: {stats['entropy']:.3f} bits/symbol\n"
+            f"Avg Code Length: {stats['avg_length']:.3f} bits\n"
+            f"Efficiency: {stats['efficiency']:.1f}%"
         )
         self.stats_label.config(text=stats_text)
 
+    def insert_table_rows(self, rows, start):
+        """Insert one batch of table rows and schedule the next"""
+        if self.code_stats is None or rows is not self.code_stats['rows']:
+            return  # A newer build replaced the table
+            
+        end = min(start + self.table_batch_size, len(rows))
+        for i in range(start, end):
+            self.tree_view.insert('', 'end', values=rows[i])
+            
+        if end < len(rows):
+            self.root.after(1, lambda: self.insert_table_rows(rows, end))
+
     def start_build(self):
         """Start the building process"""
         if self.is_animating:
@@ -443,7 +565,35 @@ class HuffmanCoding:
         if not freq_map:
             return
             
-        self.huffman_tree, self.steps = self.build_huffman_tree(freq_map)
+        self.freq_map = freq_map
+        
+        # A cached canonical codebook for a similar histogram skips the build
+        cached = self.codebook_cache.lookup(freq_map) if self.use_cache.get() else None
+        if cached:
+            lengths, loss = cached
+            self.huffman_tree = tree_from_codes(canonical_codes(lengths), freq_map)
+            self.leaves, self.steps = [], []
+        else:
+            self.huffman_tree, self.leaves, self.steps = self.build_huffman_tree(freq_map)
+        
+        # Lay out the final tree once; every forest subtree reuses its shape
+        self.layout = cached_layout(self.huffman_tree)
+        self.extents = subtree_extents(self.huffman_tree, self.layout)
+        
+        # Codes and stats are computed once per build, not per table refresh
+        self.codes = {}
+        self.generate_codes(self.huffman_tree)
+        self.code_stats = self.compute_stats(freq_map, self.codes)
+        
+        if cached:
+            self.forest = {}
+            self.draw_tree([self.huffman_tree])
+            self.step_label.config(text=f"Reused cached codebook (est. loss {loss:.2f}%)", fg="#a6e3a1")
+            self.update_table()
+            return
+        if self.use_cache.get():
+            self.codebook_cache.store(freq_map, {char: len(code) for char, code in self.codes.items()})
+        
         self.animation_step = 0
         self.is_animating = True
         self.animate_step()
@@ -455,6 +605,8 @@ class HuffmanCoding:
         self.canvas.delete("all")
         self.step_label.config(text="Ready")
         self.stats_label.config(text="Waiting to build...")
+        self.code_stats = None
+        self.forest = {}
         for item in self.tree_view.get_children():
             self.tree_view.delete(item)
         self.is_animating = False
@@ -0,0 +1,132 @@
+"""
+Huffman Coding - Word and N-gram Modelling
+Author: DSA Project
+Description: Tokenizes input into words or byte n-grams and Huffman-codes the tokens with a compact canonical dictionary
+"""
+
+import collections
+import re
+
+from huffman_codec import (
+    huffman_code_lengths, canonical_codes, canonical_table, decode_canonical, pack_codes
+)
+
+
+MODEL_MAGIC = b"HUFT"
+MODES = {"words": 0, "ngrams": 1}
+
+# Word runs and the separator runs between them; concatenating the tokens
+# always reproduces the input exactly
+WORD_PATTERN = re.compile(rb"[A-Za-z0-9_]+|[^A-Za-z0-9_]+")
+
+
+def tokenize(data, mode="words", n=2):
+    """Split bytes into word/separator runs or fixed n-byte grams"""
+    if mode == "words":
+        return WORD_PATTERN.findall(data)
+    if mode == "ngrams":
+        return [data[i:i + n] for i in range(0, len(data), n)]
+    raise ValueError(f"Unknown modelling mode: {mode}")
+
+
+def build_model(tokens):
+    """Token frequencies and canonical code lengths (no tree nodes or step history)"""
+    freq_map = collections.Counter(tokens)
+    return freq_map, huffman_code_lengths(freq_map)
+
+
+def write_varint(out, value):
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def read_varint(buf, pos):
+    value = 0
+    shift = 0
+    while True:
+        byte = buf[pos]
+        pos += 1
+        value |= (byte & 0x7F) << shift
+        if byte < 0x80:
+            return value, pos
+        shift += 7
+
+
+def pack_dictionary(lengths):
+    """Serialize a token codebook compactly.
+
+    Only the number of tokens per code length and the tokens themselves
+    in canonical order are stored; the codes follow from those. Tokens
+    are front-coded against their predecessor, which is cheap because
+    canonical order sorts tokens of equal length lexicographically.
+    """
+    ordered, count, _, _ = canonical_table(lengths)
+    out = bytearray()
+    write_varint(out, len(count) - 1)
+    for c in count[1:]:
+        write_varint(out, c)
+
+    previous = b""
+    for token in ordered:
+        shared = 0
+        limit = min(len(previous), len(token))
+        while shared < limit and previous[shared] == token[shared]:
+            shared += 1
+        write_varint(out, shared)
+        write_varint(out, len(token) - shared)
+        out += token[shared:]
+        previous = token
+    return out
+
+
+def unpack_dictionary(buf, pos=0):
+    """Inverse of pack_dictionary; returns (lengths, position after the dictionary)"""
+    max_length, pos = read_varint(buf, pos)
+    counts = []
+    for _ in range(max_length):
+        c, pos = read_varint(buf, pos)
+        counts.append(c)
+
+    lengths = {}
+    previous = b""
+    for length, c in enumerate(counts, start=1):
+        for _ in range(c):
+            shared, pos = read_varint(buf, pos)
+            size, pos = read_varint(buf, pos)
+            token = previous[:shared] + bytes(buf[pos:pos + size])
+            pos += size
+            lengths[token] = length
+            previous = token
+    return lengths, pos
+
+
+def encode_tokens(data, mode="words", n=2):
+    """Compress bytes with a word or n-gram Huffman model.
+
+    Layout: magic, mode, n, token count, packed dictionary, bit stream.
+    """
+    tokens = tokenize(data, mode, n)
+    _, lengths = build_model(tokens)
+    codes = canonical_codes(lengths)
+
+    out = bytearray(MODEL_MAGIC)
+    out.append(MODES[mode])
+    out.append(n if mode == "ngrams" else 0)
+    write_varint(out, len(tokens))
+    out += pack_dictionary(lengths)
+    out += pack_codes(tokens, codes)
+    return bytes(out)
+
+
+def decode_tokens(blob):
+    """Decompress the output of encode_tokens"""
+    if blob[:4] != MODEL_MAGIC:
+        raise ValueError("Not a token-model Huffman stream")
+    n_tokens, pos = read_varint(blob, 6)
+    if n_tokens == 0:
+        return b""
+    lengths, pos = unpack_dictionary(blob, pos)
+    tokens = decode_canonical(memoryview(blob)[pos:], n_tokens, canonical_table(lengths))
+    return b"".join(tokens)
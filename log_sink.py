@@ -0,0 +1,132 @@
+"""
+Log Sink - Buffered Text Widget Output
+Author: DSA Project
+Description: Frame-batched log writer for Tk Text widgets that keeps only recent lines on screen and spills the full log to a file
+"""
+
+import os
+import tempfile
+from collections import deque
+
+import tkinter as tk
+
+
+class LogSink:
+    """Buffers log text and flushes it into a Text widget once per frame.
+
+    The widget holds at most max_lines lines; older lines are trimmed from
+    the top. Pending text is itself a ring buffer, so a burst of writes
+    between frames never queues more than one screenful. Every line is also
+    appended to a spill file (a temporary file unless spill_path is given)
+    so the complete log survives the trimming. close() deletes a temporary
+    spill file; one at a caller-supplied spill_path is kept.
+    """
+
+    def __init__(self, widget, max_lines=1000, frame_ms=16, spill=True, spill_path=None):
+        self.widget = widget
+        self.max_lines = max_lines
+        self.frame_ms = frame_ms
+        self.spill = spill
+        self.spill_path = spill_path
+        self.spill_file = None
+        self.spill_temporary = False
+
+        self.pending = deque()      # (text, tags, line count) chunks not yet shown
+        self.pending_lines = 0
+        self.overflowed = False     # Pending text alone fills the widget
+        self.visible_lines = 0
+        self.scheduled = False
+
+    def write(self, text, *tags):
+        """Queue text for the next frame and append it to the spill file"""
+        if not text:
+            return
+        if self.spill:
+            self.spill_write(text)
+
+        lines = text.count("\n")
+        self.pending.append((text, tags, lines))
+        self.pending_lines += lines
+        # Drop chunks that would scroll off before ever being seen
+        while len(self.pending) > 1 and self.pending_lines - self.pending[0][2] >= self.max_lines:
+            self.pending_lines -= self.pending.popleft()[2]
+            self.overflowed = True
+
+        if not self.scheduled:
+            self.scheduled = True
+            self.widget.after(self.frame_ms, self.flush)
+
+    def flush(self):
+        """Move pending text into the widget and trim it to max_lines"""
+        self.scheduled = False
+        if not self.pending:
+            return
+
+        if self.overflowed:
+            self.widget.delete(1.0, tk.END)
+            self.visible_lines = 0
+            self.overflowed = False
+
+        # One insert per run of equally tagged chunks
+        run, run_tags = [], None
+        for text, tags, _ in self.pending:
+            if tags != run_tags and run:
+                self.widget.insert(tk.END, "".join(run), *run_tags)
+                run = []
+            run.append(text)
+            run_tags = tags
+        self.widget.insert(tk.END, "".join(run), *run_tags)
+
+        self.visible_lines += self.pending_lines
+        self.pending.clear()
+        self.pending_lines = 0
+
+        excess = self.visible_lines - self.max_lines
+        if excess > 0:
+            self.widget.delete("1.0", f"{excess + 1}.0")
+            self.visible_lines = self.max_lines
+        self.widget.see(tk.END)
+
+        if self.spill_file is not None:
+            self.spill_file.flush()
+
+    def spill_write(self, text):
+        """Append text to the spill file, creating it on first use"""
+        if self.spill_file is None:
+            if self.spill_path is None:
+                fd, self.spill_path = tempfile.mkstemp(prefix="dsa_log_", suffix=".log")
+                self.spill_file = os.fdopen(fd, "w", encoding="utf-8")
+                self.spill_temporary = True
+            else:
+                self.spill_file = open(self.spill_path, "w", encoding="utf-8")
+        self.spill_file.write(text)
+
+    def clear(self):
+        """Empty the widget, the pending buffer and the spill file"""
+        self.pending.clear()
+        self.pending_lines = 0
+        self.overflowed = False
+        self.visible_lines = 0
+        self.widget.delete(1.0, tk.END)
+        if self.spill_file is not None:
+            self.spill_file.seek(0)
+            self.spill_file.truncate()
+
+    def close(self):
+        """Close the spill file, deleting it if it was a temporary one.
+
+        Safe to call while the widget is being destroyed: pending text that
+        was never shown is dropped rather than flushed into the widget.
+        """
+        self.pending.clear()
+        self.pending_lines = 0
+        if self.spill_file is not None:
+            self.spill_file.close()
+            self.spill_file = None
+        if self.spill_temporary:
+            try:
+                os.remove(self.spill_path)
+            except OSError:
+                pass
+            self.spill_path = None
+            self.spill_temporary = False
@@ -0,0 +1,231 @@
+"""
+Parallel Tree Traversal
+Author: DSA Project
+Description: Splits an array-backed tree at a chosen depth and traverses or aggregates the subtrees in a process pool
+"""
+
+import itertools
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from array_tree import ArrayTree, NIL
+
+ORDERS = ("preorder", "inorder", "postorder", "levelorder")
+AGGREGATES = ("sum", "max", "count", "height")
+
+# Tree shared by the tasks of one worker process, set by the pool initializer
+_worker_tree = None
+
+
+def _init_worker(source):
+    """Pool initializer: load a saved tree by path (zero-copy mmap) or take it as given"""
+    global _worker_tree
+    _worker_tree = ArrayTree.load(source) if isinstance(source, str) else source
+
+
+def subtree_values(tree, start, order):
+    """Values of the subtree rooted at start; level order gives one array per level"""
+    values = tree.values
+    if order != "levelorder":
+        out = tree.new_values()
+        out.extend(map(values.__getitem__, getattr(tree, order)(start)))
+        return out
+
+    left, right = tree.left, tree.right
+    levels = []
+    level = [start]
+    while level:
+        out = tree.new_values()
+        out.extend(map(values.__getitem__, level))
+        levels.append(out)
+        below = []
+        for i in level:
+            if left[i] != NIL:
+                below.append(left[i])
+            if right[i] != NIL:
+                below.append(right[i])
+        level = below
+    return levels
+
+
+def subtree_aggregate(tree, start, kind):
+    """Sum, max, node count or height (levels) of the subtree rooted at start"""
+    if kind == "height":
+        left, right = tree.left, tree.right
+        height = 0
+        level = [start]
+        while level:
+            height += 1
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+        return height
+    if kind == "count":
+        return sum(1 for _ in tree.preorder(start))
+    values = map(tree.values.__getitem__, tree.preorder(start))
+    if kind == "sum":
+        return sum(values)
+    if kind == "max":
+        return max(values)
+    raise ValueError(f"Unknown aggregate: {kind}")
+
+
+def _traverse_task(start, order):
+    return subtree_values(_worker_tree, start, order)
+
+
+def _aggregate_task(start, kind):
+    return subtree_aggregate(_worker_tree, start, kind)
+
+
+def split_at_depth(tree, depth, order="preorder"):
+    """Skeleton of the top of the tree for the given order.
+
+    Returns (skeleton, frontier): skeleton lists ('node', i) for nodes above
+    depth and ('subtree', i) for the subtree roots at depth, in the order a
+    sequential traversal reaches them; frontier is the subtree roots, left
+    to right. Splicing each subtree's own traversal in at its placeholder
+    reproduces the full traversal exactly.
+    """
+    skeleton = []
+    if tree.root == NIL:
+        return skeleton, []
+    left, right = tree.left, tree.right
+
+    if order == "levelorder":
+        level = [tree.root]
+        for _ in range(depth):
+            skeleton.extend(("node", i) for i in level)
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+        skeleton.extend(("subtree", i) for i in level)
+        return skeleton, level
+
+    # Stack of (index, depth); depth -1 marks "emit this node now"
+    stack = [(tree.root, 0)]
+    while stack:
+        i, d = stack.pop()
+        if d < 0:
+            skeleton.append(("node", i))
+            continue
+        if d == depth:
+            skeleton.append(("subtree", i))
+            continue
+        lo = [(left[i], d + 1)] if left[i] != NIL else []
+        hi = [(right[i], d + 1)] if right[i] != NIL else []
+        if order == "preorder":
+            steps = [(i, -1)] + lo + hi
+        elif order == "inorder":
+            steps = lo + [(i, -1)] + hi
+        elif order == "postorder":
+            steps = lo + hi + [(i, -1)]
+        else:
+            raise ValueError(f"Unknown traversal order: {order}")
+        stack.extend(reversed(steps))
+
+    frontier = [i for kind, i in skeleton if kind == "subtree"]
+    return skeleton, frontier
+
+
+class ParallelTraversal:
+    """Runs traversals and aggregates of one ArrayTree on a process pool.
+
+    The tree reaches each worker once through the pool initializer: a tree
+    loaded with ArrayTree.load() is re-mapped from its file, any other tree
+    is inherited (fork) or pickled once per worker (spawn). Trees smaller
+    than min_nodes, or a single worker, are handled in-process.
+    """
+
+    def __init__(self, tree, workers=None, depth=None, min_nodes=50_000):
+        self.tree = tree
+        self.workers = workers or os.cpu_count() or 1
+        # Enough subtrees to keep every worker busy if some are small
+        self.depth = depth if depth is not None else (4 * self.workers).bit_length()
+        self.min_nodes = min_nodes
+        self.pool = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def close(self):
+        if self.pool is not None:
+            self.pool.shutdown()
+            self.pool = None
+
+    def map(self, task, local, frontier, arg):
+        """Run task over the frontier roots, in the pool when worthwhile"""
+        if self.workers == 1 or len(self.tree) < self.min_nodes or len(frontier) < 2:
+            return [local(self.tree, start, arg) for start in frontier]
+        if self.pool is None:
+            source = getattr(self.tree, "path", None) or self.tree
+            self.pool = ProcessPoolExecutor(self.workers, initializer=_init_worker,
+                                            initargs=(source,))
+        return list(self.pool.map(task, frontier, [arg] * len(frontier)))
+
+    def traverse(self, order):
+        """Values in the given order, identical to tree.traverse(order)"""
+        if order not in ORDERS:
+            raise ValueError(f"Unknown traversal order: {order}")
+        tree = self.tree
+        values = tree.values
+        skeleton, frontier = split_at_depth(tree, self.depth, order)
+        parts = self.map(_traverse_task, subtree_values, frontier, order)
+
+        out = tree.new_values()
+        if order == "levelorder":
+            out.extend(values[i] for kind, i in skeleton if kind == "node")
+            # Level L below the split is every subtree's level L, left to right
+            for level in range(max((len(p) for p in parts), default=0)):
+                for p in parts:
+                    if level < len(p):
+                        out.extend(p[level])
+            return out
+
+        parts = iter(parts)
+        for kind, i in skeleton:
+            if kind == "node":
+                out.append(values[i])
+            else:
+                out.extend(next(parts))
+        return out
+
+    def aggregate(self, kind):
+        """Sum, max, node count or height (levels) of the whole tree"""
+        if kind not in AGGREGATES:
+            raise ValueError(f"Unknown aggregate: {kind}")
+        tree = self.tree
+        if tree.root == NIL:
+            return None if kind == "max" else 0
+
+        left, right = tree.left, tree.right
+        top = []
+        top_height = 0
+        level = [tree.root]
+        for _ in range(self.depth):
+            if not level:
+                break
+            top.extend(level)
+            top_height += 1
+            level = [c for i in level for c in (left[i], right[i]) if c != NIL]
+        parts = self.map(_aggregate_task, subtree_aggregate, level, kind)
+
+        if kind == "height":
+            return max([top_height] + [self.depth + h for h in parts])
+        if kind == "count":
+            return len(top) + sum(parts)
+        top_values = map(tree.values.__getitem__, top)
+        if kind == "sum":
+            return sum(top_values) + sum(parts)
+        return max(itertools.chain(top_values, parts))
+
+
+def parallel_traverse(tree, order, workers=None, depth=None):
+    """One-shot parallel traversal; see ParallelTraversal"""
+    with ParallelTraversal(tree, workers, depth) as runner:
+        return runner.traverse(order)
+
+
+def parallel_aggregate(tree, kind, workers=None, depth=None):
+    """One-shot parallel aggregate; see ParallelTraversal"""
+    with ParallelTraversal(tree, workers, depth) as runner:
+        return runner.aggregate(kind)
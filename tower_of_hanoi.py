@@ -6,7 +6,17 @@ Description: Interactive visualization of the Tower of Hanoi puzzle with step-by
 
 import tkinter as tk
 from tkinter import ttk
+import itertools
+import random
 import time
+from log_sink import LogSink
+from hanoi_solver import (frame_stewart, frame_stewart_moves, frame_stewart_move,
+                          frame_stewart_state, hanoi_move, hanoi_moves, hanoi_state,
+                          shortest_path, solve_3peg_length, solve_3peg_moves,
+                          solve_3peg_state, towers_of)
+
+PEG_NAMES = "ABCDEF"
+
 
 class TowerOfHanoi:
     def __init__(self, root):
@@ -17,14 +27,24 @@ class TowerOfHanoi:
         
         # Algorithm variables
         self.num_disks = 3
-        self.moves = []
+        self.num_pegs = 3
+        self.move_iter = iter(())
         self.move_count = 0
+        self.total_moves = 7
         self.is_animating = False
         self.animation_speed = 500  # milliseconds
+        self.frame_ms = 16          # Target frame time (about 60 fps)
+        self.peg_positions = (250, 550, 850)
+        self.peg_spacing = 300
+        self.solution = None        # Move list when a scramble with more than 3 pegs is searched
+        self.start_towers = None
+        self.target_towers = None   # Set for 3-peg scrambles, whose moves are generated lazily
+        self.scramble_states = 200_000  # Search limit for scrambles with more than 3 pegs
+        self.disk_items = {}        # disk -> (rectangle id, label id or None)
         self.zoom_scale = 1.0
         
         # Tower state: list of lists, each inner list represents a peg
-        self.towers = [[], [], []]
+        self.towers = [[] for _ in range(self.num_pegs)]
         
         # Colors for disks (gradient from blue to purple)
         self.disk_colors = [
@@ -97,7 +117,7 @@ class TowerOfHanoi:
         self.disk_spinbox = tk.Spinbox(
             control_frame,
             from_=1,
-            to=8,
+            to=20,
             width=5,
             font=("Arial", 12),
             command=self.reset_puzzle
@@ -117,7 +137,7 @@ class TowerOfHanoi:
         
         self.speed_scale = tk.Scale(
             control_frame,
-            from_=100,
+            from_=0,
             to=2000,
             orient=tk.HORIZONTAL,
             length=150,
@@ -194,6 +214,84 @@ class TowerOfHanoi:
             width=3
         ).pack(side=tk.LEFT, padx=2)
         
+        # Number of pegs (Frame-Stewart for more than three)
+        tk.Label(
+            control_frame,
+            text="Number of Pegs:",
+            font=("Arial", 12),
+            bg="#1a1a2e",
+            fg="#ffffff"
+        ).grid(row=1, column=0, padx=10, pady=5)
+        
+        self.peg_spinbox = tk.Spinbox(
+            control_frame,
+            from_=3,
+            to=len(PEG_NAMES),
+            width=5,
+            font=("Arial", 12),
+            command=self.reset_puzzle
+        )
+        self.peg_spinbox.delete(0, tk.END)
+        self.peg_spinbox.insert(0, "3")
+        self.peg_spinbox.grid(row=1, column=1, padx=10, pady=5)
+        
+        self.scramble_button = tk.Button(
+            control_frame,
+            text="🎲 Scramble",
+            font=("Arial", 12, "bold"),
+            bg="#6BCF7F",
+            fg="#1a1a2e",
+            padx=20,
+            pady=5,
+            command=self.scramble_puzzle,
+            cursor="hand2",
+            relief=tk.FLAT
+        )
+        self.scramble_button.grid(row=1, column=4, padx=10, pady=5)
+        
+        # Timeline: jump to any move; the state is computed from the move number
+        timeline_frame = tk.Frame(self.root, bg="#1a1a2e")
+        timeline_frame.pack(pady=5)
+        
+        tk.Button(
+            timeline_frame,
+            text="⏮ Back",
+            font=("Arial", 10, "bold"),
+            bg="#0f3460",
+            fg="#ffffff",
+            command=self.step_back,
+            cursor="hand2",
+            relief=tk.FLAT,
+            width=8
+        ).pack(side=tk.LEFT, padx=5)
+        
+        self.timeline = tk.Scale(
+            timeline_frame,
+            from_=0,
+            to=self.total_moves,
+            orient=tk.HORIZONTAL,
+            length=600,
+            label="Timeline (move)",
+            bg="#1a1a2e",
+            fg="#ffffff",
+            highlightthickness=0,
+            troughcolor="#16213e",
+            command=self.seek
+        )
+        self.timeline.pack(side=tk.LEFT, padx=5)
+        
+        tk.Button(
+            timeline_frame,
+            text="Forward ⏭",
+            font=("Arial", 10, "bold"),
+            bg="#0f3460",
+            fg="#ffffff",
+            command=self.step_forward,
+            cursor="hand2",
+            relief=tk.FLAT,
+            width=8
+        ).pack(side=tk.LEFT, padx=5)
+        
         # Info panel
         info_frame = tk.Frame(self.root, bg="#1a1a2e")
         info_frame.pack(pady=10)
@@ -238,6 +336,9 @@ class TowerOfHanoi:
             relief=tk.FLAT
         )
         self.sequence_text.pack(fill=tk.BOTH, expand=True)
+        self.log = LogSink(self.sequence_text)
+        # Remove the temporary spill file when the window goes away
+        self.sequence_text.bind("<Destroy>", lambda event: self.log.close())
         
     def reset_puzzle(self):
         """Reset the puzzle to initial state"""
@@ -245,23 +346,102 @@ class TowerOfHanoi:
             return
             
         self.num_disks = int(self.disk_spinbox.get())
-        self.towers = [list(range(self.num_disks, 0, -1)), [], []]
-        self.moves = []
+        self.num_pegs = int(self.peg_spinbox.get())
+        self.layout_pegs()
+        self.solution = None
+        self.start_towers = None
+        self.target_towers = None
+        self.towers = self.state_at(0)
+        self.move_iter = iter(())
         self.move_count = 0
         
-        # Update labels
-        total_moves = (2 ** self.num_disks) - 1
-        self.move_label.config(text="Moves: 0")
-        self.total_moves_label.config(text=f"Total Moves Required: {total_moves}")
+        # Update labels; the split table is memoized, so this is a lookup after the first run
+        self.total_moves = frame_stewart(self.num_disks, self.num_pegs)[0]
+        self.show_total()
         
         # Clear sequence
-        self.sequence_text.delete(1.0, tk.END)
+        self.log.clear()
         
         self.draw_towers()
+    
+    def scramble_puzzle(self):
+        """Start from a random legal configuration and solve it optimally onto the last peg"""
+        if self.is_animating:
+            return
+        n, pegs = int(self.disk_spinbox.get()), int(self.peg_spinbox.get())
+        if pegs > 3 and pegs ** n > self.scramble_states:
+            self.log.write(f"⚠ Scrambles with {pegs} pegs are solved by exhaustive search; use fewer disks\n")
+            return
+        self.reset_puzzle()
+        
+        place = [0] + [random.randrange(pegs) for _ in range(n)]
+        start = towers_of(place, pegs)
+        target = [[] for _ in range(pegs)]
+        target[-1] = list(range(n, 0, -1))
+        # Optimal for any configuration with 3 pegs, counted without generating
+        # the moves; breadth-first search otherwise
+        self.start_towers = start
+        if pegs == 3:
+            self.target_towers = target
+            self.total_moves = solve_3peg_length(start, target)
+        else:
+            self.solution = shortest_path(start, target, self.scramble_states)
+            self.total_moves = len(self.solution)
+        self.towers = self.state_at(0)
+        self.show_total()
+        self.log.write(f"🎲 Scrambled start, {self.total_moves} moves to solve\n")
+        self.place_all_disks()
+    
+    def show_total(self):
+        """Reset the move counter and size the timeline for total_moves"""
+        self.move_label.config(text="Moves: 0")
+        self.total_moves_label.config(text=f"Total Moves Required: {self.total_moves}")
+        self.timeline.config(to=self.total_moves)
+        self.timeline.set(0)
+    
+    def layout_pegs(self):
+        """Spread the pegs evenly over the base, three pegs at the classic spacing"""
+        k = self.num_pegs
+        self.peg_spacing = min(300, 1000 / k)
+        self.peg_positions = tuple(550 + (i - (k - 1) / 2) * self.peg_spacing for i in range(k))
+    
+    def state_at(self, k):
+        """Peg contents after the first k moves"""
+        if self.target_towers is not None:
+            return solve_3peg_state(k, self.start_towers, self.target_towers)
+        if self.solution is not None:
+            towers = [list(tower) for tower in self.start_towers]
+            for source, destination in itertools.islice(self.solution, k):
+                towers[destination].append(towers[source].pop())
+            return towers
+        if self.num_pegs == 3:
+            return hanoi_state(k, self.num_disks)
+        return frame_stewart_state(k, self.num_disks, self.num_pegs)
+    
+    def move_at(self, k):
+        """(source, destination) of move k (1-based)"""
+        if self.target_towers is not None:
+            return next(solve_3peg_moves(self.start_towers, self.target_towers, k))
+        if self.solution is not None:
+            return self.solution[k - 1]
+        if self.num_pegs == 3:
+            return hanoi_move(k, self.num_disks)
+        return frame_stewart_move(k, self.num_disks, self.num_pegs)
+    
+    def moves_from(self, k):
+        """Lazy iterator over moves k, k + 1, ... to the end"""
+        if self.target_towers is not None:
+            return solve_3peg_moves(self.start_towers, self.target_towers, k)
+        if self.solution is not None:
+            return itertools.islice(self.solution, k - 1, None)
+        if self.num_pegs == 3:
+            return hanoi_moves(self.num_disks, k)
+        return frame_stewart_moves(self.num_disks, self.num_pegs, start=k)
         
     def draw_towers(self):
-        """Draw the current state of towers"""
+        """Create the base, pegs and one set of items per disk; moves only reposition them"""
         self.canvas.delete("all")
+        self.disk_items = {}
         
         # Draw base
         base_x1, base_y1 = 50 * self.zoom_scale, 350 * self.zoom_scale
@@ -274,8 +454,10 @@ class TowerOfHanoi:
         )
         
         # Peg positions
-        peg_positions = [250, 550, 850]
-        peg_names = ["Source (A)", "Auxiliary (B)", "Destination (C)"]
+        peg_positions = self.peg_positions
+        last = PEG_NAMES[self.num_pegs - 1]
+        peg_names = ["Source (A)"] + [f"Auxiliary ({name})" if self.num_pegs == 3 else name
+                                      for name in PEG_NAMES[1:self.num_pegs - 1]] + [f"Destination ({last})"]
         
         # Draw pegs
         for i, (x, name) in enumerate(zip(peg_positions, peg_names)):
@@ -302,32 +484,71 @@ class TowerOfHanoi:
                 fill="#ffffff"
             )
             
-            # Draw disks on this peg
-            for j, disk_size in enumerate(self.towers[i]):
-                disk_width = (40 + (disk_size * 25)) * self.zoom_scale
-                disk_height = 25 * self.zoom_scale
-                y = (350 * self.zoom_scale) - (j + 1) * disk_height
-                
-                # Disk with gradient effect (simulated with outline)
-                color_idx = disk_size - 1
-                self.canvas.create_rectangle(
-                    x - disk_width // 2, y,
-                    x + disk_width // 2, y + disk_height - (5 * self.zoom_scale),
-                    fill=self.disk_colors[color_idx % len(self.disk_colors)],
-                    outline="#ffffff",
-                    width=2 * self.zoom_scale
-                )
-                
-                # Disk number
-                self.canvas.create_text(
-                    x, y + disk_height // 2 - (2 * self.zoom_scale),
-                    text=str(disk_size),
-                    font=("Arial", int(12*self.zoom_scale), "bold"),
-                    fill="#ffffff"
-                )
+        # Draw disks
+        for peg, tower in enumerate(self.towers):
+            for level, disk in enumerate(tower):
+                self.draw_disk(disk, peg, level)
         
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
 
+    def disk_geometry(self, disk, peg, level):
+        """Rectangle and label coordinates of a disk at a stack level on a peg"""
+        n = self.num_disks
+        x = self.peg_positions[peg] * self.zoom_scale
+        # Shrink disks for tall towers so up to 20 fit, and for more pegs so neighbours don't touch
+        disk_width = (40 + disk * 25 * min(1, 8 / n)) * self.peg_spacing / 300 * self.zoom_scale
+        disk_height = min(25, 180 / n) * self.zoom_scale
+        y = (350 * self.zoom_scale) - (level + 1) * disk_height
+        rect = (x - disk_width // 2, y, x + disk_width // 2, y + disk_height - (disk_height / 5))
+        label = (x, y + disk_height // 2 - (disk_height / 12))
+        return rect, label, disk_height
+    
+    def draw_disk(self, disk, peg, level):
+        """Create the canvas items of one disk and remember them for later moves"""
+        rect, label, disk_height = self.disk_geometry(disk, peg, level)
+        tags = ("disk", f"disk_{disk}")
+        
+        # Disk with gradient effect (simulated with outline)
+        color_idx = disk - 1
+        rect_id = self.canvas.create_rectangle(
+            *rect,
+            fill=self.disk_colors[color_idx % len(self.disk_colors)],
+            outline="#ffffff",
+            width=2 * self.zoom_scale,
+            tags=tags
+        )
+        
+        # Disk number, when there is room for it
+        text_id = None
+        if disk_height >= 12:
+            text_id = self.canvas.create_text(
+                *label,
+                text=str(disk),
+                font=("Arial", int(12 * disk_height / 25), "bold"),
+                fill="#ffffff",
+                tags=tags
+            )
+        self.disk_items[disk] = (rect_id, text_id)
+    
+    def place_disk(self, disk, peg, level):
+        """Move an existing disk's items to a new position"""
+        rect, label, _ = self.disk_geometry(disk, peg, level)
+        rect_id, text_id = self.disk_items[disk]
+        self.canvas.coords(rect_id, *rect)
+        if text_id is not None:
+            self.canvas.coords(text_id, *label)
+    
+    def redraw_disks(self, moved):
+        """Reposition only the given disks ({disk: (peg, level)})"""
+        for disk, (peg, level) in moved.items():
+            self.place_disk(disk, peg, level)
+    
+    def place_all_disks(self):
+        """Reposition every disk to match self.towers"""
+        for peg, tower in enumerate(self.towers):
+            for level, disk in enumerate(tower):
+                self.place_disk(disk, peg, level)
+    
     def zoom_in(self):
         self.zoom_scale *= 1.1
         self.draw_towers()
@@ -336,16 +557,6 @@ class TowerOfHanoi:
         self.zoom_scale /= 1.1
         self.draw_towers()
     
-    def tower_of_hanoi(self, n, source, destination, auxiliary):
-        """Recursive Tower of Hanoi algorithm"""
-        if n == 1:
-            self.moves.append((source, destination))
-            return
-        
-        self.tower_of_hanoi(n - 1, source, auxiliary, destination)
-        self.moves.append((source, destination))
-        self.tower_of_hanoi(n - 1, auxiliary, destination, source)
-    
     def solve_puzzle(self):
         """Solve the puzzle and animate"""
         if self.is_animating:
@@ -354,48 +565,103 @@ class TowerOfHanoi:
         self.is_animating = True
         self.solve_button.config(state=tk.DISABLED)
         self.disk_spinbox.config(state=tk.DISABLED)
+        self.peg_spinbox.config(state=tk.DISABLED)
         
-        # Generate moves
-        self.moves = []
-        self.tower_of_hanoi(self.num_disks, 0, 2, 1)
+        # Moves are generated lazily, continuing from the current timeline position
+        self.move_iter = self.moves_from(self.move_count + 1)
         
         # Start animation
         self.animate_moves(0)
     
     def animate_moves(self, move_index):
-        """Animate the moves one by one"""
-        if move_index >= len(self.moves):
+        """Apply as many moves as the speed allows in one frame, then redraw the moved disks"""
+        delay = self.speed_scale.get()
+        frame_start = time.perf_counter()
+        deadline = frame_start + self.frame_ms * 0.8 / 1000
+        # Slow speeds get one move per frame; fast ones batch to keep the frame rate
+        batch = 1 if delay >= self.frame_ms else (self.frame_ms // delay if delay else None)
+        
+        moved = {}
+        finished = False
+        count = 0
+        for move in self.move_iter:
+            disk, peg, level = self.apply_move(*move)
+            moved[disk] = (peg, level)
+            count += 1
+            if count == batch or (count & 63 == 0 and time.perf_counter() > deadline):
+                break
+        else:
+            finished = True
+        
+        self.redraw_disks(moved)
+        self.update_counters()
+        
+        if finished:
             # Animation complete
             self.is_animating = False
             self.solve_button.config(state=tk.NORMAL)
             self.disk_spinbox.config(state=tk.NORMAL)
+            self.peg_spinbox.config(state=tk.NORMAL)
             
-            self.sequence_text.insert(tk.END, "\n✅ Puzzle Solved!\n", "success")
+            self.log.write("\n✅ Puzzle Solved!\n", "success")
             return
         
-        # Get current move
-        source, destination = self.moves[move_index]
-        
-        # Move disk
+        # Schedule next frame
+        if delay < self.frame_ms:
+            elapsed = (time.perf_counter() - frame_start) * 1000
+            delay = max(1, int(self.frame_ms - elapsed))
+        self.root.after(delay, lambda: self.animate_moves(self.move_count))
+    
+    def apply_move(self, source, destination):
+        """Move the top disk between pegs and log it; returns (disk, peg, level)"""
         disk = self.towers[source].pop()
-        self.towers[destination].append(disk)
-        
-        # Update display
+        tower = self.towers[destination]
+        tower.append(disk)
         self.move_count += 1
-        self.move_label.config(text=f"Moves: {self.move_count}")
         
         # Add to sequence
-        peg_names = ['A', 'B', 'C']
-        move_text = f"Move {self.move_count}: Disk {disk} from {peg_names[source]} to {peg_names[destination]}\n"
-        self.sequence_text.insert(tk.END, move_text)
-        self.sequence_text.see(tk.END)
-        
-        # Redraw
-        self.draw_towers()
-        
-        # Schedule next move
-        delay = self.speed_scale.get()
-        self.root.after(delay, lambda: self.animate_moves(move_index + 1))
+        self.log.write(f"Move {self.move_count}: Disk {disk} from {PEG_NAMES[source]} to {PEG_NAMES[destination]}\n")
+        return disk, destination, len(tower) - 1
+    
+    def update_counters(self):
+        """Show the current move number on the label and timeline"""
+        self.move_label.config(text=f"Moves: {self.move_count}")
+        self.timeline.set(self.move_count)
+    
+    def step_forward(self):
+        """Apply the next move in O(1)"""
+        if self.is_animating or self.move_count >= self.total_moves:
+            return
+        disk, peg, level = self.apply_move(*self.move_at(self.move_count + 1))
+        self.redraw_disks({disk: (peg, level)})
+        self.update_counters()
+    
+    def step_back(self):
+        """Undo the last move in O(1)"""
+        if self.is_animating or self.move_count == 0:
+            return
+        source, destination = self.move_at(self.move_count)
+        disk = self.towers[destination].pop()
+        self.towers[source].append(disk)
+        
+        self.move_count -= 1
+        self.update_counters()
+        self.log.write(f"↩ Undo: Disk {disk} back to {PEG_NAMES[source]}\n")
+        self.redraw_disks({disk: (source, len(self.towers[source]) - 1)})
+    
+    def seek(self, value):
+        """Timeline callback: jump straight to the state after move value"""
+        k = int(float(value))
+        if k == self.move_count:
+            return
+        self.towers = self.state_at(k)
+        self.move_count = k
+        self.move_label.config(text=f"Moves: {self.move_count}")
+        self.log.write(f"⏩ Jumped to move {k}\n")
+        if self.is_animating:
+            # Keep playing from the new position
+            self.move_iter = self.moves_from(k + 1)
+        self.place_all_disks()
 
 
 def main():
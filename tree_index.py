@@ -0,0 +1,301 @@
+"""
+Tree Index - In-order Links and Euler Times
+Author: DSA Project
+Description: Precomputed in-order links, Euler times and an Euler-tour sparse table for O(1) neighbour, ancestor and LCA queries
+"""
+
+from array import array
+from itertools import accumulate
+
+
+class InorderIndex:
+    """In-order neighbour links over a binary tree of value/left/right nodes.
+
+    successor() and predecessor() are dict lookups, range scans follow the
+    links for O(k) after locating the start, and is_ancestor() compares
+    Euler-tour entry/exit times. add() keeps the links exact after a BST
+    insert in O(height). The Euler times are not maintained incrementally:
+    an insert (and any rebalancing rotation) can shift every time after it,
+    so add() marks them stale and the next is_ancestor() call rebuilds them
+    in O(n). Ancestor checks are O(1) only between structural changes;
+    alternating inserts and ancestor queries costs O(n) per query.
+    """
+
+    def __init__(self, root):
+        self.root = root
+        self.next = {}
+        self.prev = {}
+        self.first = None
+        self.last = None
+        self.tin = {}
+        self.tout = {}
+        self.euler_stale = True
+
+        previous = None
+        stack = []
+        node = root
+        while stack or node is not None:
+            while node is not None:
+                stack.append(node)
+                node = node.left
+            node = stack.pop()
+            self.link(previous, node)
+            previous = node
+            node = node.right
+        self.link(previous, None)
+
+    def __len__(self):
+        return len(self.next)
+
+    def link(self, a, b):
+        """Make b follow a in order; either may be None for the ends"""
+        if a is None:
+            self.first = b
+        else:
+            self.next[a] = b
+        if b is None:
+            self.last = a
+        else:
+            self.prev[b] = a
+
+    def successor(self, node):
+        """Next node in order, or None"""
+        return self.next[node]
+
+    def predecessor(self, node):
+        """Previous node in order, or None"""
+        return self.prev[node]
+
+    def iter_from(self, node=None):
+        """Nodes in order starting at node (default: the first)"""
+        node = self.first if node is None else node
+        while node is not None:
+            yield node
+            node = self.next[node]
+
+    def lower_bound(self, value):
+        """First node whose value is >= value, by one BST descent"""
+        best = None
+        node = self.root
+        while node is not None:
+            if node.value < value:
+                node = node.right
+            else:
+                best = node
+                node = node.left
+        return best
+
+    def range_nodes(self, lo, hi):
+        """Nodes with lo <= value <= hi in a BST, in order, in O(height + k)"""
+        node = self.lower_bound(lo)
+        while node is not None and node.value <= hi:
+            yield node
+            node = self.next[node]
+
+    def range_scan(self, lo, hi):
+        """Values v with lo <= v <= hi in a BST"""
+        return [node.value for node in self.range_nodes(lo, hi)]
+
+    def add(self, node, path):
+        """Link a node just inserted into a BST.
+
+        path is the search path from the root down to node (as returned by
+        BalancedBST.search_path), taken after any rebalancing.
+        """
+        self.root = path[0]
+        before = after = None
+        for ancestor, child in zip(path, path[1:]):
+            if child is ancestor.right:
+                before = ancestor
+            else:
+                after = ancestor
+        # Rotations may already have given the node children
+        if node.left is not None:
+            before = node.left
+            while before.right is not None:
+                before = before.right
+        if node.right is not None:
+            after = node.right
+            while after.left is not None:
+                after = after.left
+
+        self.link(before, node)
+        self.link(node, after)
+        self.euler_stale = True
+
+    def insert(self, value, node_class):
+        """Insert value into a plain (unbalanced) BST and index it; returns the node or None"""
+        if self.root is None:
+            node = self.root = node_class(value)
+            self.link(None, node)
+            self.link(node, None)
+            self.euler_stale = True
+            return node
+        path = []
+        current = self.root
+        while current is not None:
+            if value == current.value:
+                return None
+            path.append(current)
+            current = current.left if value < current.value else current.right
+        node = node_class(value)
+        if value < path[-1].value:
+            path[-1].left = node
+        else:
+            path[-1].right = node
+        self.add(node, path + [node])
+        return node
+
+    def rebuild_euler(self):
+        """Entry/exit times from one iterative depth-first walk"""
+        self.tin = {}
+        self.tout = {}
+        clock = 0
+        stack = [(self.root, False)] if self.root is not None else []
+        while stack:
+            node, done = stack.pop()
+            if done:
+                self.tout[node] = clock
+                clock += 1
+                continue
+            self.tin[node] = clock
+            clock += 1
+            stack.append((node, True))
+            if node.right is not None:
+                stack.append((node.right, False))
+            if node.left is not None:
+                stack.append((node.left, False))
+        self.euler_stale = False
+
+    def is_ancestor(self, a, b):
+        """True if a is b or an ancestor of b; O(1), or O(n) on the first call after a change"""
+        if self.euler_stale:
+            self.rebuild_euler()
+        return self.tin[a] <= self.tin[b] and self.tout[b] <= self.tout[a]
+
+
+class LCAEngine:
+    """Lowest common ancestors and subtree aggregates for a static tree.
+
+    Nodes are numbered in pre-order, so every ancestor has a smaller number
+    than its descendants and each subtree is the contiguous number range
+    [i, i + size[i]). On the Euler tour, the LCA of a and b is then simply
+    the smallest number between their first visits, which a sparse table of
+    range minima answers in O(1) after O(n log n) preprocessing. Subtree
+    sums come from pre-order prefix sums, subtree maxima from a second
+    sparse table built on first use. Rebuild the engine after the tree
+    changes.
+    """
+
+    def __init__(self, root):
+        self.nodes = []     # Pre-order
+        self.index = {}     # Node -> pre-order number
+        self.depth = array("q")
+        self.euler = array("q")
+        self.first = array("q")
+        self.prefix = None
+        self.max_table = None
+
+        # Iterative Euler tour; ("return", i) re-enters node i after a child
+        stack = [(root, 0)] if root is not None else []
+        while stack:
+            node, depth = stack.pop()
+            if node is None:
+                self.euler.append(depth)
+                continue
+            i = len(self.nodes)
+            self.index[node] = i
+            self.nodes.append(node)
+            self.depth.append(depth)
+            self.first.append(len(self.euler))
+            self.euler.append(i)
+            for child in (node.right, node.left):
+                if child is not None:
+                    stack.append((None, i))
+                    stack.append((child, depth + 1))
+
+        # Subtree sizes, children before parents
+        n = len(self.nodes)
+        self.size = array("q", [1]) * n
+        for i in range(n - 1, -1, -1):
+            node = self.nodes[i]
+            for child in (node.left, node.right):
+                if child is not None:
+                    self.size[i] += self.size[self.index[child]]
+
+        self.table = self.sparse_table(self.euler)
+
+    def __len__(self):
+        return len(self.nodes)
+
+    @staticmethod
+    def sparse_table(values):
+        """Rows of range minima over windows of 1, 2, 4, ... entries (arrays stay arrays)"""
+        table = [values]
+        width = 1
+        while 2 * width <= len(values):
+            prev = table[-1]
+            row = map(min, prev, prev[width:])
+            table.append(array(prev.typecode, row) if isinstance(prev, array) else list(row))
+            width *= 2
+        return table
+
+    def lca(self, a, b):
+        """Lowest common ancestor of nodes a and b in O(1)"""
+        i = self.first[self.index[a]]
+        j = self.first[self.index[b]]
+        if i > j:
+            i, j = j, i
+        k = (j - i + 1).bit_length() - 1
+        row = self.table[k]
+        return self.nodes[min(row[i], row[j - (1 << k) + 1])]
+
+    def batch_lca(self, pairs):
+        """LCAs for many (a, b) pairs; lookups are hoisted out of one tight loop"""
+        index, first, table, nodes = self.index, self.first, self.table, self.nodes
+        out = []
+        append = out.append
+        for a, b in pairs:
+            i = first[index[a]]
+            j = first[index[b]]
+            if i > j:
+                i, j = j, i
+            k = (j - i + 1).bit_length() - 1
+            row = table[k]
+            append(nodes[min(row[i], row[j - (1 << k) + 1])])
+        return out
+
+    def is_ancestor(self, a, b):
+        """True if a is b or an ancestor of b"""
+        i, j = self.index[a], self.index[b]
+        return i <= j < i + self.size[i]
+
+    def distance(self, a, b):
+        """Number of edges on the path between a and b"""
+        depth, index = self.depth, self.index
+        return depth[index[a]] + depth[index[b]] - 2 * depth[index[self.lca(a, b)]]
+
+    def subtree_range(self, node):
+        """Pre-order number range [start, stop) covering node's subtree"""
+        i = self.index[node]
+        return i, i + self.size[i]
+
+    def subtree_size(self, node):
+        return self.size[self.index[node]]
+
+    def subtree_sum(self, node):
+        """Sum of the values in node's subtree in O(1)"""
+        if self.prefix is None:
+            self.prefix = [0] + list(accumulate(node.value for node in self.nodes))
+        start, stop = self.subtree_range(node)
+        return self.prefix[stop] - self.prefix[start]
+
+    def subtree_max(self, node):
+        """Largest value in node's subtree in O(1)"""
+        if self.max_table is None:
+            negated = [-node.value for node in self.nodes]
+            self.max_table = self.sparse_table(negated)
+        start, stop = self.subtree_range(node)
+        k = (stop - start).bit_length() - 1
+        row = self.max_table[k]
+        return -min(row[start], row[stop - (1 << k)])
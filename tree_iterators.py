@@ -0,0 +1,125 @@
+"""
+Binary Tree Traversals - Lazy Iterators
+Author: DSA Project
+Description: Binary tree node and stack-based, level-order and Morris traversals that stream nodes lazily, free of any GUI dependency
+"""
+
+from collections import deque
+
+
+class TreeNode:
+    """Binary Tree Node"""
+    def __init__(self, value):
+        self.value = value
+        self.left = None
+        self.right = None
+
+# Lazy traversals: explicit stacks instead of recursion, so degenerate
+# trees of any depth work and nodes stream out one at a time
+def iter_preorder(root):
+    """Pre-order: Root -> Left -> Right"""
+    stack = [root] if root else []
+    while stack:
+        node = stack.pop()
+        yield node
+        if node.right:
+            stack.append(node.right)
+        if node.left:
+            stack.append(node.left)
+
+def iter_inorder(root):
+    """In-order: Left -> Root -> Right"""
+    stack = []
+    node = root
+    while stack or node:
+        while node:
+            stack.append(node)
+            node = node.left
+        node = stack.pop()
+        yield node
+        node = node.right
+
+def iter_postorder(root):
+    """Post-order: Left -> Right -> Root"""
+    stack = []
+    node = root
+    last = None
+    while stack or node:
+        if node:
+            stack.append(node)
+            node = node.left
+        else:
+            top = stack[-1]
+            if top.right and last is not top.right:
+                node = top.right
+            else:
+                last = stack.pop()
+                yield last
+
+def iter_levelorder(root):
+    """Level-order: Breadth-first traversal"""
+    queue = deque([root] if root else [])
+    while queue:
+        node = queue.popleft()
+        yield node
+        if node.left:
+            queue.append(node.left)
+        if node.right:
+            queue.append(node.right)
+
+def _morris(root, preorder):
+    """Morris threaded traversal with O(1) extra space.
+
+    Temporarily threads each in-order predecessor's right pointer back to
+    its successor. If the consumer stops early, the walk is finished
+    without yielding so every thread is removed again.
+    """
+    node = root
+    try:
+        while node:
+            if node.left is None:
+                yield node
+                node = node.right
+                continue
+                
+            pred = node.left
+            while pred.right and pred.right is not node:
+                pred = pred.right
+                
+            if pred.right is None:
+                pred.right = node
+                if preorder:
+                    yield node
+                node = node.left
+            else:
+                pred.right = None
+                if not preorder:
+                    yield node
+                node = node.right
+    except GeneratorExit:
+        _unthread(node)
+        raise
+
+def _unthread(node):
+    """Complete an interrupted Morris walk silently, removing its threads"""
+    while node:
+        if node.left is None:
+            node = node.right
+            continue
+        pred = node.left
+        while pred.right and pred.right is not node:
+            pred = pred.right
+        if pred.right is None:
+            pred.right = node
+            node = node.left
+        else:
+            pred.right = None
+            node = node.right
+
+def morris_inorder(root):
+    """In-order traversal in O(1) extra space"""
+    return _morris(root, preorder=False)
+
+def morris_preorder(root):
+    """Pre-order traversal in O(1) extra space"""
+    return _morris(root, preorder=True)
@@ -0,0 +1,244 @@
+"""
+Tidy Tree Layout - Reingold-Tilford / Walker
+Author: DSA Project
+Description: Linear-time tidy drawing of binary trees (Buchheim-Junger-Leipert improvement of Walker's algorithm)
+"""
+
+from collections import OrderedDict
+
+
+class _WalkerNode:
+    """Layout bookkeeping for one tree node"""
+    __slots__ = ('node', 'parent', 'children', 'number', 'side', 'depth',
+                 'x', 'mod', 'thread', 'ancestor', 'change', 'shift')
+
+    def __init__(self, node, parent, number, side, depth):
+        self.node = node
+        self.parent = parent
+        self.children = []
+        self.number = number    # Position among siblings
+        self.side = side        # -1 for a left child, +1 for a right child
+        self.depth = depth
+        self.x = 0.0
+        self.mod = 0.0
+        self.thread = None
+        self.ancestor = self
+        self.change = 0.0
+        self.shift = 0.0
+
+    def next_left(self):
+        return self.children[0] if self.children else self.thread
+
+    def next_right(self):
+        return self.children[-1] if self.children else self.thread
+
+    def left_brother(self):
+        if self.parent is not None and self.number > 0:
+            return self.parent.children[self.number - 1]
+        return None
+
+
+def tidy_layout(root, distance=1.0):
+    """Lay out a binary tree of nodes with .left/.right attributes.
+
+    Returns a dict mapping each node to (x, depth). Sibling subtrees are
+    packed as closely as their contours allow, every subtree is drawn
+    identically wherever it occurs, and the leftmost node sits at x = 0.
+    Runs in O(n) without recursion, so degenerate trees are fine.
+    """
+    if root is None:
+        return {}
+
+    # Wrap nodes; visiting right before left makes the reversed listing a
+    # proper left-to-right post-order
+    top = _WalkerNode(root, None, 0, 0, 0)
+    order = []
+    stack = [top]
+    while stack:
+        v = stack.pop()
+        order.append(v)
+        for side, child in ((-1, v.node.left), (1, v.node.right)):
+            if child is not None:
+                v.children.append(_WalkerNode(child, v, len(v.children), side, v.depth + 1))
+        stack.extend(v.children)
+
+    # First walk: left siblings and children are finished before each node
+    for v in reversed(order):
+        _first_walk(v, distance)
+
+    # Second walk: accumulate modifiers top-down
+    positions = {}
+    min_x = None
+    stack = [(top, 0.0)]
+    while stack:
+        v, m = stack.pop()
+        x = v.x + m
+        positions[v.node] = (x, v.depth)
+        if min_x is None or x < min_x:
+            min_x = x
+        for w in v.children:
+            stack.append((w, m + v.mod))
+
+    if min_x:
+        positions = {node: (x - min_x, depth) for node, (x, depth) in positions.items()}
+    return positions
+
+
+class LayoutCache:
+    """Tidy layouts keyed by tree shape, most recently used first.
+
+    The key is one byte per node (which children exist) in pre-order, so
+    redraws, zooms and trees that share a shape reuse a layout instead of
+    running the layout algorithm again.
+    """
+
+    def __init__(self, max_shapes=16):
+        self.max_shapes = max_shapes
+        self.shapes = OrderedDict()
+
+    def layout(self, root, distance=1.0):
+        """Same result as tidy_layout(root, distance), served from the cache when possible"""
+        nodes = []
+        flags = bytearray()
+        stack = [root] if root is not None else []
+        while stack:
+            node = stack.pop()
+            nodes.append(node)
+            flags.append((node.left is not None) | (node.right is not None) << 1)
+            if node.right is not None:
+                stack.append(node.right)
+            if node.left is not None:
+                stack.append(node.left)
+
+        key = (bytes(flags), distance)
+        positions = self.shapes.get(key)
+        if positions is None:
+            layout = tidy_layout(root, distance)
+            positions = [layout[node] for node in nodes]
+            self.shapes[key] = positions
+            if len(self.shapes) > self.max_shapes:
+                self.shapes.popitem(last=False)
+        else:
+            self.shapes.move_to_end(key)
+        return dict(zip(nodes, positions))
+
+
+_default_cache = LayoutCache()
+
+
+def cached_layout(root, distance=1.0):
+    """tidy_layout backed by a shared shape-keyed cache"""
+    return _default_cache.layout(root, distance)
+
+
+def subtree_extents(root, positions):
+    """Return a dict mapping each node to the (min_x, max_x) of its subtree"""
+    extents = {}
+    order = []
+    stack = [root] if root is not None else []
+    while stack:
+        node = stack.pop()
+        order.append(node)
+        if node.left is not None:
+            stack.append(node.left)
+        if node.right is not None:
+            stack.append(node.right)
+
+    for node in reversed(order):
+        x = positions[node][0]
+        lo = hi = x
+        for child in (node.left, node.right):
+            if child is not None:
+                c_lo, c_hi = extents[child]
+                lo = min(lo, c_lo)
+                hi = max(hi, c_hi)
+        extents[node] = (lo, hi)
+    return extents
+
+
+def _first_walk(v, distance):
+    brother = v.left_brother()
+    if not v.children:
+        v.x = brother.x + distance if brother is not None else 0.0
+        return
+
+    default_ancestor = v.children[0]
+    for w in v.children:
+        default_ancestor = _apportion(w, default_ancestor, distance)
+    _execute_shifts(v)
+
+    if len(v.children) == 2:
+        midpoint = (v.children[0].x + v.children[1].x) / 2
+    else:
+        # Keep a lone child on its own side of the parent
+        only = v.children[0]
+        midpoint = only.x - only.side * distance / 2
+
+    if brother is not None:
+        v.x = brother.x + distance
+        v.mod = v.x - midpoint
+    else:
+        v.x = midpoint
+
+
+def _apportion(v, default_ancestor, distance):
+    w = v.left_brother()
+    if w is None:
+        return default_ancestor
+
+    vir = vor = v
+    vil = w
+    vol = v.parent.children[0]
+    sir = sor = v.mod
+    sil = vil.mod
+    sol = vol.mod
+
+    while vil.next_right() is not None and vir.next_left() is not None:
+        vil = vil.next_right()
+        vir = vir.next_left()
+        vol = vol.next_left()
+        vor = vor.next_right()
+        vor.ancestor = v
+        shift = (vil.x + sil) - (vir.x + sir) + distance
+        if shift > 0:
+            _move_subtree(_ancestor(vil, v, default_ancestor), v, shift)
+            sir += shift
+            sor += shift
+        sil += vil.mod
+        sir += vir.mod
+        sol += vol.mod
+        sor += vor.mod
+
+    if vil.next_right() is not None and vor.next_right() is None:
+        vor.thread = vil.next_right()
+        vor.mod += sil - sor
+    else:
+        if vir.next_left() is not None and vol.next_left() is None:
+            vol.thread = vir.next_left()
+            vol.mod += sir - sol
+        default_ancestor = v
+    return default_ancestor
+
+
+def _move_subtree(wl, wr, shift):
+    subtrees = wr.number - wl.number
+    wr.change -= shift / subtrees
+    wr.shift += shift
+    wl.change += shift / subtrees
+    wr.x += shift
+    wr.mod += shift
+
+
+def _execute_shifts(v):
+    shift = change = 0.0
+    for w in reversed(v.children):
+        w.x += shift
+        w.mod += shift
+        change += w.change
+        shift += w.shift + change
+
+
+def _ancestor(vil, v, default_ancestor):
+    if vil.ancestor.parent is v.parent:
+        return vil.ancestor
+    return default_ancestor
@@ -6,15 +6,15 @@ Description: Interactive visualization of Pre-order, In-order, Post-order, and L
 
 import tkinter as tk
 from tkinter import ttk
-from collections import deque
+import itertools
 import time
-
-class TreeNode:
-    """Binary Tree Node"""
-    def __init__(self, value):
-        self.value = value
-        self.left = None
-        self.right = None
+from array_tree import ArrayTree
+from balanced_bst import AVLTree, RedBlackTree
+from log_sink import LogSink
+from parallel_tree import ParallelTraversal
+from tree_index import InorderIndex
+from tree_iterators import TreeNode, iter_preorder, iter_inorder, iter_postorder, iter_levelorder
+from tree_layout import cached_layout
 
 class TreeTraversals:
     def __init__(self, root):
@@ -29,10 +29,25 @@ class TreeTraversals:
         
         # Visualization variables
         self.node_positions = {}
+        self.node_items = {}
         self.is_animating = False
-        self.current_traversal = []
+        self.fast_forward = False
+        self.fast_forward_batch = 250
+        self.sequence_preview = 100  # Values shown in the final sequence line
+        
+        # Balanced BST mode: rotations are recorded as layout snapshots and tweened
+        self.bst = None
+        self.bst_kinds = {"AVL": AVLTree, "Red-Black": RedBlackTree}
+        self.inorder_index = None   # Built on demand; dropped whenever the tree changes shape
+        self.rotation_frames = []
+        self.tween_steps = 12
+        self.current_traversal = []     # First sequence_preview visited nodes
+        self.traversal_iter = iter(())
         self.animation_speed = 800
         self.zoom_scale = 1.0
+        self.x_unit = 60
+        self.level_height = 80
+        self.margin = 50
         
         # Colors
         self.node_color = "#4a90e2"
@@ -60,6 +75,33 @@ class TreeTraversals:
         self.tree_root.right.left = TreeNode(6)
         self.tree_root.right.right = TreeNode(7)
         
+    def build_from_input(self):
+        """Build the displayed tree from the level-order entry"""
+        if self.is_animating:
+            return
+        
+        items = []
+        for token in self.build_entry.get().split(','):
+            token = token.strip()
+            if token.lower() in ("", "none", "null"):
+                items.append(None)
+            else:
+                try:
+                    items.append(int(token))
+                except ValueError:
+                    items.append(token)
+        
+        # Packed int64 storage only when every value fits; anything else stays a Python object
+        values = [v for v in items if v is not None]
+        fits = all(isinstance(v, int) and -2 ** 63 <= v < 2 ** 63 for v in values)
+        typecode = "q" if fits else None
+        self.tree_root = ArrayTree.from_level_order(items, typecode).to_nodes()
+        # The balanced tree is no longer on display; BST operations start afresh
+        self.bst = None
+        self.inorder_index = None
+        self.reset_visualization()
+        self.draw_tree()
+        
     def setup_ui(self):
         """Setup the user interface"""
         # Title
@@ -165,6 +207,122 @@ class TreeTraversals:
         )
         reset_btn.pack(pady=10)
         
+        # Fast-forward applies many highlight updates per frame
+        self.ff_btn = tk.Button(
+            right_frame,
+            text="⏩ Fast-forward: Off",
+            font=("Arial", 12, "bold"),
+            bg="#2d3436",
+            fg="#ffffff",
+            padx=20,
+            pady=5,
+            command=self.toggle_fast_forward,
+            cursor="hand2",
+            relief=tk.FLAT,
+            width=20
+        )
+        self.ff_btn.pack(pady=5)
+        
+        # Aggregates over the whole tree, split across worker processes when large
+        tk.Button(
+            right_frame,
+            text="📊 Tree Stats",
+            font=("Arial", 12, "bold"),
+            bg="#2d3436",
+            fg="#ffffff",
+            padx=20,
+            pady=5,
+            command=self.show_tree_stats,
+            cursor="hand2",
+            relief=tk.FLAT,
+            width=20
+        ).pack(pady=5)
+        
+        # Build a custom tree from a level-order list
+        tk.Label(
+            right_frame,
+            text="Level-order values (None = gap):",
+            font=("Arial", 12),
+            bg="#0f0f1e",
+            fg="#ffffff"
+        ).pack(pady=5)
+        
+        self.build_entry = tk.Entry(
+            right_frame,
+            font=("Courier", 11),
+            bg="#1a1a2e",
+            fg="#ffffff",
+            insertbackground="#ffffff",
+            width=28
+        )
+        self.build_entry.insert(0, "1, 2, 3, 4, 5, 6, 7")
+        self.build_entry.pack(pady=5)
+        
+        tk.Button(
+            right_frame,
+            text="🌱 Build Tree",
+            font=("Arial", 12, "bold"),
+            bg="#00b894",
+            fg="#ffffff",
+            padx=20,
+            pady=5,
+            command=self.build_from_input,
+            cursor="hand2",
+            relief=tk.FLAT,
+            width=20
+        ).pack(pady=5)
+        
+        # Balanced BST operations
+        tk.Label(
+            right_frame,
+            text="Balanced BST (comma-separated values):",
+            font=("Arial", 12),
+            bg="#0f0f1e",
+            fg="#ffffff"
+        ).pack(pady=5)
+        
+        bst_frame = tk.Frame(right_frame, bg="#0f0f1e")
+        bst_frame.pack(pady=5)
+        
+        self.bst_box = ttk.Combobox(
+            bst_frame,
+            values=list(self.bst_kinds),
+            state="readonly",
+            width=10
+        )
+        self.bst_box.current(0)
+        self.bst_box.pack(side=tk.LEFT, padx=5)
+        
+        self.bst_entry = tk.Entry(
+            bst_frame,
+            font=("Courier", 11),
+            bg="#1a1a2e",
+            fg="#ffffff",
+            insertbackground="#ffffff",
+            width=14
+        )
+        self.bst_entry.pack(side=tk.LEFT, padx=5)
+        
+        bst_btns = tk.Frame(right_frame, bg="#0f0f1e")
+        bst_btns.pack(pady=5)
+        
+        for text, command, color in (
+            ("➕ Insert", self.bst_insert, "#00b894"),
+            ("➖ Delete", self.bst_delete, "#ff6b6b"),
+            ("🔎 Search", self.bst_search, "#4ecdc4"),
+        ):
+            tk.Button(
+                bst_btns,
+                text=text,
+                font=("Arial", 11, "bold"),
+                bg=color,
+                fg="#ffffff",
+                command=command,
+                cursor="hand2",
+                relief=tk.FLAT,
+                width=9
+            ).pack(side=tk.LEFT, padx=3)
+        
         # Speed control
         tk.Label(
             right_frame,
@@ -246,25 +404,17 @@ class TreeTraversals:
             relief=tk.FLAT
         )
         self.output_text.pack(fill=tk.BOTH, expand=True)
-        
-    def calculate_positions(self, node, x, y, level, h_spacing):
-        """Calculate positions for all nodes"""
-        if node is None:
-            return
-        
-        self.node_positions[node] = (x, y)
-        
-        # Calculate positions for children
-        vertical_spacing = 80
-        next_y = y + vertical_spacing
-        
-        if node.left:
-            left_x = x - h_spacing
-            self.calculate_positions(node.left, left_x, next_y, level + 1, h_spacing // 2)
-        
-        if node.right:
-            right_x = x + h_spacing
-            self.calculate_positions(node.right, right_x, next_y, level + 1, h_spacing // 2)
+        self.log = LogSink(self.output_text)
+        # Remove the temporary spill file when the window goes away
+        self.output_text.bind("<Destroy>", lambda event: self.log.close())
+        
+    def calculate_positions(self):
+        """Calculate positions for all nodes from the shared tidy layout"""
+        layout = cached_layout(self.tree_root)
+        self.node_positions = {
+            node: (self.margin + x * self.x_unit, self.margin + depth * self.level_height)
+            for node, (x, depth) in layout.items()
+        }
     
     def draw_tree(self):
         """Draw the binary tree"""
@@ -274,16 +424,11 @@ class TreeTraversals:
             return
         
         # Calculate positions
-        self.node_positions = {}
-        canvas_width = 800 # Base width
-        start_x = canvas_width // 2
-        start_y = 50
-        initial_spacing = 200
-        
-        self.calculate_positions(self.tree_root, start_x, start_y, 0, initial_spacing)
+        self.calculate_positions()
+        self.node_items = {}
         
         # Draw edges first
-        self.draw_edges(self.tree_root)
+        self.draw_edges()
         
         # Draw nodes
         for node, (x, y) in self.node_positions.items():
@@ -291,57 +436,41 @@ class TreeTraversals:
             
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
-    def draw_edges(self, node):
-        """Draw edges between nodes"""
-        if node is None:
-            return
-        
-        x1, y1 = self.node_positions[node]
-        # Apply zoom
-        x1 *= self.zoom_scale
-        y1 *= self.zoom_scale
-        
-        if node.left:
-            x2, y2 = self.node_positions[node.left]
-            x2 *= self.zoom_scale
-            y2 *= self.zoom_scale
-            
-            self.canvas.create_line(
-                x1, y1, x2, y2,
-                fill=self.edge_color,
-                width=2 * self.zoom_scale,
-                tags="edge"
-            )
-            self.draw_edges(node.left)
-        
-        if node.right:
-            x2, y2 = self.node_positions[node.right]
-            x2 *= self.zoom_scale
-            y2 *= self.zoom_scale
+    def draw_edges(self, edges=None):
+        """Draw edges between nodes (the given parent/child pairs, or the tree's own)"""
+        if edges is None:
+            edges = [
+                (node, child) for node in self.node_positions
+                for child in (node.left, node.right) if child is not None
+            ]
+        for parent, child in edges:
+            # Apply zoom
+            x1, y1 = self.node_positions[parent]
+            x2, y2 = self.node_positions[child]
             
             self.canvas.create_line(
-                x1, y1, x2, y2,
+                x1 * self.zoom_scale, y1 * self.zoom_scale,
+                x2 * self.zoom_scale, y2 * self.zoom_scale,
                 fill=self.edge_color,
                 width=2 * self.zoom_scale,
                 tags="edge"
             )
-            self.draw_edges(node.right)
     
     def draw_node(self, node, x, y, color):
-        """Draw a single node"""
+        """Draw a single node and remember its circle for recoloring"""
         # Apply zoom
         x *= self.zoom_scale
         y *= self.zoom_scale
         radius = 25 * self.zoom_scale
         
         # Circle
-        self.canvas.create_oval(
+        self.node_items[node] = self.canvas.create_oval(
             x - radius, y - radius,
             x + radius, y + radius,
             fill=color,
-            outline="#ffffff",
+            outline="#ff4757" if getattr(node, "red", False) else "#ffffff",
             width=3 * self.zoom_scale,
-            tags=f"node_{id(node)}"
+            tags=("node", f"node_{id(node)}")
         )
         
         # Value
@@ -354,12 +483,185 @@ class TreeTraversals:
         )
     
     def highlight_node(self, node, color):
-        """Highlight a specific node"""
-        if node in self.node_positions:
-            x, y = self.node_positions[node]
-            self.canvas.delete(f"node_{id(node)}")
-            self.draw_node(node, x, y, color)
+        """Highlight a specific node by recoloring its existing circle"""
+        item = self.node_items.get(node)
+        if item is not None:
+            self.canvas.itemconfig(item, fill=color)
+    
+    def toggle_fast_forward(self):
+        """Switch between step-by-step and batched animation"""
+        self.fast_forward = not self.fast_forward
+        self.ff_btn.config(text=f"⏩ Fast-forward: {'On' if self.fast_forward else 'Off'}")
 
+    def show_tree_stats(self):
+        """Log sum, max, node count and height of the current tree"""
+        if self.is_animating:
+            return
+        tree = ArrayTree.from_nodes(self.tree_root, typecode=None)
+        try:
+            with ParallelTraversal(tree) as runner:
+                stats = {kind: runner.aggregate(kind) for kind in ("count", "height", "sum", "max")}
+        except TypeError:
+            self.log.write("\nTree stats need numeric node values\n")
+            return
+        self.log.write("\nTree Stats\n", "header")
+        for kind, value in stats.items():
+            self.log.write(f"  {kind.capitalize()}: {value}\n")
+    
+    def bst_values(self):
+        """Integers typed in the BST entry"""
+        values = []
+        for token in self.bst_entry.get().split(','):
+            token = token.strip()
+            if token:
+                try:
+                    values.append(int(token))
+                except ValueError:
+                    self.log.write(f"Ignoring non-integer value: {token}\n")
+        return values
+    
+    def ensure_bst(self):
+        """Start a fresh balanced tree if none is shown or the tree type changed"""
+        kind = self.bst_kinds[self.bst_box.get()]
+        if not isinstance(self.bst, kind):
+            self.bst = kind(on_rotate=self.record_rotation)
+            self.tree_root = None
+            self.inorder_index = None
+            self.node_positions = {}
+            self.log.write(f"Started an empty {self.bst_box.get()} tree\n")
+        return self.bst
+    
+    def snapshot_tree(self):
+        """Canvas positions and parent/child edges of the balanced tree right now"""
+        layout = cached_layout(self.bst.root)
+        positions = {
+            node: (self.margin + x * self.x_unit, self.margin + depth * self.level_height)
+            for node, (x, depth) in layout.items()
+        }
+        edges = [
+            (node, child) for node in positions
+            for child in (node.left, node.right) if child is not None
+        ]
+        return positions, edges
+    
+    def record_rotation(self, direction, node, pivot):
+        """Rotation callback: keep a frame of the tree just after the rotation"""
+        self.rotation_frames.append((f"  ↻ Rotate {direction} at {node.value}", *self.snapshot_tree()))
+    
+    def bst_insert(self):
+        """Insert the entered values; a single value animates its rotations"""
+        if self.is_animating:
+            return
+        values = self.bst_values()
+        if not values:
+            return
+        bst = self.ensure_bst()
+        if len(values) > 1:
+            added = bst.bulk_insert(values)
+            self.log.write(f"Bulk-inserted {added} new value(s); tree has {len(bst)} nodes\n")
+            self.tree_root = bst.root
+            self.inorder_index = None
+            self.draw_tree()
+            return
+        self.run_bst_operation(bst.insert, values[0], "Insert")
+    
+    def bst_delete(self):
+        """Delete the entered values, animating the rebalancing rotations"""
+        if self.is_animating or self.bst is None:
+            return
+        values = self.bst_values()
+        if len(values) == 1:
+            self.run_bst_operation(self.bst.delete, values[0], "Delete")
+            return
+        removed = sum(self.bst.delete(value) for value in values)
+        self.log.write(f"Deleted {removed} value(s); tree has {len(self.bst)} nodes\n")
+        self.tree_root = self.bst.root
+        self.inorder_index = None
+        self.draw_tree()
+    
+    def get_inorder_index(self):
+        """In-order links for the current tree, built on first use"""
+        if self.inorder_index is None:
+            self.inorder_index = InorderIndex(self.tree_root)
+        return self.inorder_index
+    
+    def bst_search(self):
+        """Animate the search path for one value, or the in-order range scan for two"""
+        if self.is_animating or self.bst is None:
+            return
+        values = self.bst_values()
+        if not values:
+            return
+        if len(values) > 1:
+            lo, hi = sorted(values[:2])
+            nodes = list(self.get_inorder_index().range_nodes(lo, hi))
+            self.start_traversal(lambda root: iter(nodes), "Range",
+                                 f"{lo} to {hi}: {len(nodes)} value(s)")
+            return
+        path = self.bst.search_path(values[0])
+        found = bool(path) and path[-1].value == values[0]
+        result = "found" if found else "not found"
+        self.start_traversal(lambda root: iter(path), "Search",
+                             f"{values[0]} {result} after {len(path)} comparison(s)")
+    
+    def run_bst_operation(self, operation, value, name):
+        """Apply one insert/delete and animate the rotations it caused"""
+        start = dict(self.node_positions)
+        self.rotation_frames = []
+        old_root = self.bst.root
+        changed = operation(value)
+        self.log.write(f"{name} {value}: {'done' if changed else 'no change'} "
+                       f"({len(self.rotation_frames)} rotation(s))\n")
+        frames = self.rotation_frames + [("", *self.snapshot_tree())]
+        self.rotation_frames = []
+        self.tree_root = self.bst.root
+        index = self.inorder_index
+        if changed and name == "Insert" and index is not None and index.root is old_root:
+            # A new node only links into its in-order neighbours
+            self.inorder_index.add(self.bst.search(value), self.bst.search_path(value))
+        elif changed:
+            self.inorder_index = None
+        if not changed or self.tree_root is None:
+            self.draw_tree()
+            return
+        
+        # Fresh items for the final node set, each starting where it was last seen
+        self.canvas.delete("all")
+        self.node_items = {}
+        self.node_positions = {}
+        for node in frames[-1][1]:
+            first = start.get(node) or next(f[1][node] for f in frames if node in f[1])
+            self.node_positions[node] = first
+            self.draw_node(node, *first, self.node_color)
+        self.is_animating = True
+        self.tween_frames(frames, 0, 0, dict(self.node_positions))
+    
+    def tween_frames(self, frames, index, step, origin):
+        """Slide nodes from origin towards frame index, one tween step per call"""
+        label, target, edges = frames[index]
+        if step == 0 and label:
+            self.log.write(label + "\n")
+        
+        t = (step + 1) / self.tween_steps
+        for node, (tx, ty) in target.items():
+            ox, oy = origin.get(node, (tx, ty))
+            x, y = ox + (tx - ox) * t, oy + (ty - oy) * t
+            cx, cy = self.node_positions[node]
+            self.canvas.move(f"node_{id(node)}", (x - cx) * self.zoom_scale, (y - cy) * self.zoom_scale)
+            self.node_positions[node] = (x, y)
+        self.canvas.delete("edge")
+        self.draw_edges([(p, c) for p, c in edges if p in self.node_positions and c in self.node_positions])
+        self.canvas.tag_lower("edge")
+        
+        delay = max(15, self.speed_scale.get() // self.tween_steps)
+        if step + 1 < self.tween_steps:
+            self.root.after(delay, lambda: self.tween_frames(frames, index, step + 1, origin))
+        elif index + 1 < len(frames):
+            self.root.after(delay, lambda: self.tween_frames(frames, index + 1, 0, dict(self.node_positions)))
+        else:
+            self.is_animating = False
+            self.draw_tree()
+    
     def zoom_in(self):
         self.zoom_scale *= 1.1
         self.draw_tree()
@@ -371,127 +673,93 @@ class TreeTraversals:
     # Traversal Algorithms
     def preorder_helper(self, node, result):
         """Pre-order: Root -> Left -> Right"""
-        if node:
-            result.append(node)
-            self.preorder_helper(node.left, result)
-            self.preorder_helper(node.right, result)
+        result.extend(iter_preorder(node))
     
     def inorder_helper(self, node, result):
         """In-order: Left -> Root -> Right"""
-        if node:
-            self.inorder_helper(node.left, result)
-            result.append(node)
-            self.inorder_helper(node.right, result)
+        result.extend(iter_inorder(node))
     
     def postorder_helper(self, node, result):
         """Post-order: Left -> Right -> Root"""
-        if node:
-            self.postorder_helper(node.left, result)
-            self.postorder_helper(node.right, result)
-            result.append(node)
+        result.extend(iter_postorder(node))
     
     def levelorder_helper(self, root):
         """Level-order: Breadth-first traversal"""
-        if not root:
-            return []
-        
-        result = []
-        queue = deque([root])
-        
-        while queue:
-            node = queue.popleft()
-            result.append(node)
-            
-            if node.left:
-                queue.append(node.left)
-            if node.right:
-                queue.append(node.right)
-        
-        return result
+        return list(iter_levelorder(root))
     
-    def preorder_traversal(self):
-        """Start pre-order traversal animation"""
+    def start_traversal(self, traversal, name, header):
+        """Reset the view and start animating a lazy traversal"""
         if self.is_animating:
             return
         
         self.reset_visualization()
-        self.current_traversal = []
-        self.preorder_helper(self.tree_root, self.current_traversal)
+        self.traversal_iter = traversal(self.tree_root)
         
-        self.output_text.insert(tk.END, "Pre-order Traversal (Root → Left → Right)\n", "header")
-        self.output_text.insert(tk.END, "=" * 50 + "\n\n")
+        self.log.write(f"{name} Traversal ({header})\n", "header")
+        self.log.write("=" * 50 + "\n\n")
         
-        self.animate_traversal(0, "Pre-order")
+        self.animate_traversal(0, name)
+    
+    def preorder_traversal(self):
+        """Start pre-order traversal animation"""
+        self.start_traversal(iter_preorder, "Pre-order", "Root → Left → Right")
     
     def inorder_traversal(self):
         """Start in-order traversal animation"""
-        if self.is_animating:
-            return
-        
-        self.reset_visualization()
-        self.current_traversal = []
-        self.inorder_helper(self.tree_root, self.current_traversal)
-        
-        self.output_text.insert(tk.END, "In-order Traversal (Left → Root → Right)\n", "header")
-        self.output_text.insert(tk.END, "=" * 50 + "\n\n")
-        
-        self.animate_traversal(0, "In-order")
+        # Follows the precomputed successor links instead of re-walking from the root
+        self.start_traversal(lambda root: self.get_inorder_index().iter_from(),
+                             "In-order", "Left → Root → Right")
     
     def postorder_traversal(self):
         """Start post-order traversal animation"""
-        if self.is_animating:
-            return
-        
-        self.reset_visualization()
-        self.current_traversal = []
-        self.postorder_helper(self.tree_root, self.current_traversal)
-        
-        self.output_text.insert(tk.END, "Post-order Traversal (Left → Right → Root)\n", "header")
-        self.output_text.insert(tk.END, "=" * 50 + "\n\n")
-        
-        self.animate_traversal(0, "Post-order")
+        self.start_traversal(iter_postorder, "Post-order", "Left → Right → Root")
     
     def levelorder_traversal(self):
         """Start level-order traversal animation"""
-        if self.is_animating:
-            return
-        
-        self.reset_visualization()
-        self.current_traversal = self.levelorder_helper(self.tree_root)
-        
-        self.output_text.insert(tk.END, "Level-order Traversal (Breadth-First)\n", "header")
-        self.output_text.insert(tk.END, "=" * 50 + "\n\n")
-        
-        self.animate_traversal(0, "Level-order")
+        self.start_traversal(iter_levelorder, "Level-order", "Breadth-First")
     
     def animate_traversal(self, index, traversal_name):
-        """Animate the traversal step by step"""
-        if index >= len(self.current_traversal):
+        """Animate the traversal, pulling one node (or a fast-forward batch) per frame"""
+        steps = self.fast_forward_batch if self.fast_forward else 1
+        batch = list(itertools.islice(self.traversal_iter, steps))
+        if not batch:
             self.is_animating = False
-            self.output_text.insert(tk.END, f"\n✅ {traversal_name} traversal complete!\n")
+            self.traversal_iter = iter(())
+            self.log.write(f"\n✅ {traversal_name} traversal complete!\n")
             
-            # Show final sequence
-            sequence = " → ".join([str(node.value) for node in self.current_traversal])
-            self.output_text.insert(tk.END, f"\nFinal Sequence: {sequence}\n")
+            # Show final sequence; long runs are summarized, the spill file has every step
+            shown = self.current_traversal[:self.sequence_preview]
+            sequence = " → ".join([str(node.value) for node in shown])
+            hidden = index - len(shown)
+            if hidden:
+                sequence += f" → … ({hidden} more, full log: {self.log.spill_path})"
+            self.log.write(f"\nFinal Sequence: {sequence}\n")
             return
         
         self.is_animating = True
-        node = self.current_traversal[index]
+        # Only the preview is kept; index counts the rest, so memory stays bounded
+        room = self.sequence_preview - len(self.current_traversal)
+        if room > 0:
+            self.current_traversal.extend(batch[:room])
         
-        # Highlight current node
+        # Skipped-over nodes go straight to visited; the last one is current
+        for node in batch[:-1]:
+            self.highlight_node(node, self.visited_color)
+        node = batch[-1]
         self.highlight_node(node, self.current_color)
         
         # Add to output
-        self.output_text.insert(tk.END, f"Step {index + 1}: Visit node {node.value}\n")
-        self.output_text.see(tk.END)
+        self.log.write("".join(
+            f"Step {index + i + 1}: Visit node {visited.value}\n" for i, visited in enumerate(batch)
+        ))
         
         # Schedule next step
-        delay = self.speed_scale.get()
+        delay = 1 if self.fast_forward else self.speed_scale.get()
         
         def next_step():
             # Mark as visited
             self.highlight_node(node, self.visited_color)
-            self.animate_traversal(index + 1, traversal_name)
+            self.animate_traversal(index + len(batch), traversal_name)
         
         self.root.after(delay, next_step)
     
@@ -499,8 +767,11 @@ class TreeTraversals:
         """Reset the visualization"""
         self.is_animating = False
         self.current_traversal = []
-        self.output_text.delete(1.0, tk.END)
-        self.draw_tree()
+        self.traversal_iter = iter(())
+        self.log.clear()
+        
+        # Recolor the existing circles instead of redrawing the tree
+        self.canvas.itemconfig("node", fill=self.node_color)
 
 
 def main():